@@ -0,0 +1,26 @@
+#!/usr/bin/env sh
+# Compile the GraphUtil batch helpers into src/pyccwebgraph/jars/.
+#
+# Usage: java/build_helpers.sh [path/to/cc-webgraph-jar-with-dependencies.jar]
+#
+# The cc-webgraph JAR defaults to $CC_WEBGRAPH_JAR. It is only needed at
+# compile time; the resulting pyccwebgraph-helpers.jar holds GraphUtil
+# alone and is put on the classpath next to it by CCWebgraph.load_graph().
+set -eu
+
+here=$(cd "$(dirname "$0")" && pwd)
+cc_jar=${1:-${CC_WEBGRAPH_JAR:-}}
+if [ -z "$cc_jar" ] || [ ! -f "$cc_jar" ]; then
+    echo "usage: $0 path/to/cc-webgraph-jar-with-dependencies.jar" >&2
+    echo "(or set CC_WEBGRAPH_JAR)" >&2
+    exit 1
+fi
+
+out="$here/../src/pyccwebgraph/jars/pyccwebgraph-helpers.jar"
+classes=$(mktemp -d)
+trap 'rm -rf "$classes"' EXIT
+
+javac --release 17 -Xlint:all -Werror -cp "$cc_jar" -d "$classes" \
+    "$here/org/commoncrawl/webgraph/explore/GraphUtil.java"
+jar cf "$out" -C "$classes" .
+echo "Built $out"
@@ -0,0 +1,28 @@
+#!/usr/bin/env sh
+# Check out and build the cc-webgraph revision GraphUtil is compiled against.
+#
+# Usage: java/fetch_cc_webgraph.sh [dest_dir]
+#
+# GraphUtil calls Graph methods directly, so it must be compiled against
+# the same cc-webgraph code as the cc-webgraph-0.1-SNAPSHOT JAR users run;
+# building against a moving main branch could leave the helpers calling
+# methods that JAR doesn't have. The pin is the last commit on main
+# before CC_WEBGRAPH_BEFORE, which resolves to the same commit every time.
+# Set CC_WEBGRAPH_REF to a tag or SHA to build another revision.
+set -eu
+
+CC_WEBGRAPH_BEFORE=2025-03-01
+CC_WEBGRAPH_VERSION=0.1-SNAPSHOT
+
+dest=${1:-cc-webgraph}
+git clone --quiet https://github.com/commoncrawl/cc-webgraph "$dest"
+ref=${CC_WEBGRAPH_REF:-$(git -C "$dest" rev-list -1 --before="$CC_WEBGRAPH_BEFORE" origin/main)}
+git -C "$dest" checkout --quiet "$ref"
+echo "cc-webgraph at $(git -C "$dest" rev-parse HEAD)"
+
+version=$(mvn -B -q -f "$dest/pom.xml" help:evaluate -Dexpression=project.version -DforceStdout)
+if [ "$version" != "$CC_WEBGRAPH_VERSION" ]; then
+    echo "cc-webgraph $ref is version $version, expected $CC_WEBGRAPH_VERSION" >&2
+    exit 1
+fi
+mvn -B -q -f "$dest/pom.xml" package -DskipTests
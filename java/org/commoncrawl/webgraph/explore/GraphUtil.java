@@ -0,0 +1,198 @@
+package org.commoncrawl.webgraph.explore;
+
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.charset.StandardCharsets;
+import java.util.Arrays;
+
+import it.unimi.dsi.fastutil.ints.Int2IntMap;
+import it.unimi.dsi.fastutil.ints.Int2IntOpenHashMap;
+import it.unimi.dsi.fastutil.ints.IntArrays;
+import it.unimi.dsi.fastutil.ints.IntOpenHashSet;
+
+/**
+ * Batch helpers used by pyccwebgraph.
+ *
+ * Every py4j call is a blocking socket round trip, so these methods fuse
+ * loops that would otherwise run in Python (one call per vertex) into a
+ * single call. It is compiled against the cc-webgraph JAR by
+ * <code>java/build_helpers.sh</code> into
+ * <code>pyccwebgraph-helpers.jar</code>, which pyccwebgraph adds to the
+ * JVM classpath when present; the Python side falls back to per-vertex
+ * calls when it is not available.
+ */
+public class GraphUtil {
+
+	/**
+	 * Fetch the neighbors of several vertices at once.
+	 *
+	 * @param graph     loaded graph
+	 * @param ids       vertex IDs
+	 * @param backlinks if true return predecessors, otherwise successors
+	 * @return flat array <code>[len0, n00, n01, ..., len1, n10, ...]</code>
+	 *         with one length-prefixed block per input vertex
+	 */
+	public static int[] neighborsBatch(Graph graph, long[] ids, boolean backlinks) {
+		int[][] lists = new int[ids.length][];
+		int total = ids.length;
+		for (int i = 0; i < ids.length; i++) {
+			lists[i] = backlinks ? graph.predecessors(ids[i]) : graph.successors(ids[i]);
+			total += lists[i].length;
+		}
+		int[] out = new int[total];
+		int pos = 0;
+		for (int[] list : lists) {
+			out[pos++] = list.length;
+			System.arraycopy(list, 0, out, pos, list.length);
+			pos += list.length;
+		}
+		return out;
+	}
+
+	/**
+	 * Pack an int[] into raw little-endian bytes.
+	 *
+	 * py4j transfers byte[] as a single binary blob, which is much cheaper
+	 * than formatting the array as text and parsing it back in Python.
+	 */
+	public static byte[] intsToBytes(int[] values) {
+		ByteBuffer buf = ByteBuffer.allocate(4 * values.length).order(ByteOrder.LITTLE_ENDIAN);
+		buf.asIntBuffer().put(values);
+		return buf.array();
+	}
+
+	/**
+	 * Unpack raw little-endian int64 bytes into a long[].
+	 *
+	 * Lets Python build a long[] with one call instead of one call per
+	 * element assignment.
+	 */
+	public static long[] bytesToLongArray(byte[] bytes) {
+		long[] values = new long[bytes.length / 8];
+		ByteBuffer.wrap(bytes).order(ByteOrder.LITTLE_ENDIAN).asLongBuffer().get(values);
+		return values;
+	}
+
+	/** Pack a long[] into raw little-endian bytes. */
+	public static byte[] longsToBytes(long[] values) {
+		ByteBuffer buf = ByteBuffer.allocate(8 * values.length).order(ByteOrder.LITTLE_ENDIAN);
+		buf.asLongBuffer().put(values);
+		return buf.array();
+	}
+
+	/**
+	 * Look up the labels of several vertices at once.
+	 *
+	 * @param graph loaded graph
+	 * @param ids   vertex IDs
+	 * @return UTF-8 encoded labels joined by newlines, one line per input
+	 *         vertex; unknown vertices yield an empty line
+	 */
+	public static byte[] vertexIdsToLabels(Graph graph, long[] ids) {
+		StringBuilder sb = new StringBuilder();
+		for (int i = 0; i < ids.length; i++) {
+			if (i > 0) {
+				sb.append('\n');
+			}
+			String label = graph.vertexIdToLabel(ids[i]);
+			if (label != null) {
+				sb.append(label);
+			}
+		}
+		return sb.toString().getBytes(StandardCharsets.UTF_8);
+	}
+
+	/**
+	 * Look up the vertex IDs of several labels at once.
+	 *
+	 * @param graph  loaded graph
+	 * @param labels vertex labels (reversed domain names) joined by newlines;
+	 *               callers must not pass labels that contain a newline
+	 * @return little-endian int64 IDs, one per label, -1 for unknown labels
+	 */
+	public static byte[] labelsToIds(Graph graph, String labels) {
+		String[] parts = labels.split("\n", -1);
+		long[] ids = new long[parts.length];
+		for (int i = 0; i < parts.length; i++) {
+			ids[i] = graph.vertexLabelToId(parts[i]);
+		}
+		return longsToBytes(ids);
+	}
+
+	/**
+	 * Run the whole discovery aggregation on the Java side.
+	 *
+	 * For every seed, counts how many seeds each neighbor (excluding the
+	 * seeds themselves) is connected to and keeps neighbors with at least
+	 * <code>minConnections</code> connections. Seeds are processed
+	 * sequentially: random access on a shared BVGraph is not thread-safe.
+	 *
+	 * @param graph          loaded graph
+	 * @param seedIds        seed vertex IDs
+	 * @param minConnections minimum seed connections for a neighbor to be kept
+	 * @param backlinks      if true use predecessors, otherwise successors
+	 * @return little-endian int64 values
+	 *         <code>[numUnique, S, E, ids[S], counts[S], edgeSeedIdx[E]]</code>:
+	 *         the number of distinct neighbors before filtering, the kept
+	 *         neighbor IDs in ascending order with their counts, and the
+	 *         seed index of every kept edge grouped by neighbor in the same
+	 *         order
+	 */
+	public static byte[] discover(Graph graph, long[] seedIds, int minConnections, boolean backlinks) {
+		IntOpenHashSet seeds = new IntOpenHashSet(seedIds.length);
+		for (long id : seedIds) {
+			seeds.add((int) id);
+		}
+
+		int[][] lists = new int[seedIds.length][];
+		Int2IntOpenHashMap counts = new Int2IntOpenHashMap();
+		for (int i = 0; i < seedIds.length; i++) {
+			lists[i] = backlinks ? graph.predecessors(seedIds[i]) : graph.successors(seedIds[i]);
+			for (int n : lists[i]) {
+				if (!seeds.contains(n)) {
+					counts.addTo(n, 1);
+				}
+			}
+		}
+
+		int numKept = 0;
+		int[] kept = new int[counts.size()];
+		for (Int2IntMap.Entry e : counts.int2IntEntrySet()) {
+			if (e.getIntValue() >= minConnections) {
+				kept[numKept++] = e.getIntKey();
+			}
+		}
+		kept = Arrays.copyOf(kept, numKept);
+		IntArrays.quickSort(kept);
+
+		// Slot of each kept neighbor in the edge section, and its fill position
+		Int2IntOpenHashMap slot = new Int2IntOpenHashMap(numKept);
+		slot.defaultReturnValue(-1);
+		int[] fill = new int[numKept];
+		int numEdges = 0;
+		for (int k = 0; k < numKept; k++) {
+			slot.put(kept[k], k);
+			fill[k] = numEdges;
+			numEdges += counts.get(kept[k]);
+		}
+
+		long[] out = new long[3 + 2 * numKept + numEdges];
+		out[0] = counts.size();
+		out[1] = numKept;
+		out[2] = numEdges;
+		int edgeBase = 3 + 2 * numKept;
+		for (int k = 0; k < numKept; k++) {
+			out[3 + k] = kept[k];
+			out[3 + numKept + k] = counts.get(kept[k]);
+		}
+		for (int i = 0; i < lists.length; i++) {
+			for (int n : lists[i]) {
+				int k = slot.get(n);
+				if (k >= 0) {
+					out[edgeBase + fill[k]++] = i;
+				}
+			}
+		}
+		return longsToBytes(out);
+	}
+}
@@ -13,8 +13,13 @@ Quick start::
 """
 
 from .ccwebgraph import CCWebgraph
-from .converters import DiscoveryResult
+from .converters import DiscoveryResult, IdDiscoveryResult
 from .download import get_available_versions
 
-__all__ = ["CCWebgraph", "DiscoveryResult", "get_available_versions"]
+__all__ = [
+    "CCWebgraph",
+    "DiscoveryResult",
+    "IdDiscoveryResult",
+    "get_available_versions",
+]
 __version__ = "0.1.0"
@@ -9,25 +9,49 @@ The CommonCrawl reversed notation (e.g. "com.cnn") is handled internally.
 """
 
 import os
+import re
+import sys
 import atexit
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
 from .setup_utils import (
     DEFAULT_DATA_DIR,
     DEFAULT_VERSION,
     check_java,
+    check_label_index,
     check_offsets,
     check_webgraph_data,
+    find_helper_jar,
     find_jar,
 )
-from .converters import DiscoveryResult
+from .converters import DiscoveryResult, IdDiscoveryResult, _EdgeBuilder
+from .labels import LabelIndex, build_label_index
 
 try:
-    from py4j.java_gateway import JavaGateway, GatewayParameters, launch_gateway
+    from py4j.java_gateway import (
+        GatewayParameters,
+        JavaClass,
+        JavaGateway,
+        get_field,
+        launch_gateway,
+    )
+    from py4j.protocol import Py4JError
+    from py4j.version import __version__ as _PY4J_VERSION
     HAS_PY4J = True
 except ImportError:
     HAS_PY4J = False
 
+# Older py4j releases read large responses without buffering, which is
+# orders of magnitude slower for big neighbor arrays.
+_MIN_PY4J_VERSION = (0, 10, 9, 7)
+
+
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    """Parse a dotted version string like "0.10.9.7" into a tuple of ints."""
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
 
 def _reverse_domain(domain: str) -> str:
     """Convert normal domain to CommonCrawl reversed notation.
@@ -45,6 +69,62 @@ def _unreverse_domain(rev_domain: str) -> str:
     return ".".join(reversed(rev_domain.split(".")))
 
 
+def _aggregate(
+    ids: np.ndarray, seed_idx: np.ndarray, min_connections: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Sort-based, vectorized aggregation of neighbor IDs and seed indices."""
+    order = np.argsort(ids, kind="stable")
+    edge_ids = ids[order]
+    edge_seed_idx = seed_idx[order]
+    neighbor_ids, counts = np.unique(edge_ids, return_counts=True)
+
+    keep = counts >= min_connections
+    edge_keep = np.repeat(keep, counts)
+    return (
+        neighbor_ids[keep],
+        counts[keep],
+        edge_seed_idx[edge_keep],
+        len(neighbor_ids),
+    )
+
+
+def _count_neighbors(
+    neighbor_arrays: List[np.ndarray],
+    exclude_ids: np.ndarray,
+    min_connections: int = 1,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Count how many seeds each neighbor is connected to.
+
+    All neighbor arrays are concatenated and aggregated in one pass by a
+    sort-based NumPy kernel instead of a per-edge dict update.
+
+    Args:
+        neighbor_arrays: One array of neighbor IDs per seed.
+        exclude_ids: IDs to drop from the neighbor lists (the seeds themselves).
+        min_connections: Minimum seed connections for a neighbor to be kept.
+
+    Returns:
+        Tuple of (neighbor_ids, counts, edge_seed_idx, num_unique).
+        neighbor_ids are the ascending IDs of kept neighbors, with counts
+        aligned to them. edge_seed_idx lists the seed index of every edge,
+        grouped by neighbor in the same order as neighbor_ids.
+        num_unique is the number of distinct neighbors before filtering.
+    """
+    lens = [len(a) for a in neighbor_arrays]
+    ids_cat = np.concatenate(neighbor_arrays).astype(np.int64)
+    seed_idx = np.repeat(np.arange(len(neighbor_arrays), dtype=np.int64), lens)
+
+    # Byte mask indexed by vertex ID: one load per edge instead of the
+    # sort/hash that np.isin would need. Sized to the largest ID seen
+    # rather than the whole graph; np.zeros only touches used pages.
+    size = max(ids_cat.max(initial=-1), exclude_ids.max(initial=-1)) + 1
+    seed_mask = np.zeros(size, dtype=np.bool_)
+    seed_mask[exclude_ids] = True
+    keep = ~seed_mask[ids_cat]
+    return _aggregate(ids_cat[keep], seed_idx[keep], min_connections)
+
+
 class CCWebgraph:
     """
     Python interface to CommonCrawl's domain webgraph.
@@ -72,6 +152,9 @@ class CCWebgraph:
         wg.load_graph()
     """
 
+    # Maximum number of domain -> vertex ID lookups memoized per instance
+    _ID_CACHE_SIZE = 1 << 16
+
     # ------------------------------------------------------------------ #
     #  Construction & Setup
     # ------------------------------------------------------------------ #
@@ -95,6 +178,12 @@ class CCWebgraph:
                 "py4j is required for CCWebgraph. "
                 "Install with: pip install py4j"
             )
+        if _version_tuple(_PY4J_VERSION) < _MIN_PY4J_VERSION:
+            raise ImportError(
+                f"py4j >= 0.10.9.7 is required for CCWebgraph "
+                f"(found {_PY4J_VERSION}). "
+                "Upgrade with: pip install -U py4j"
+            )
 
         self.webgraph_dir = webgraph_dir
         self.version = version
@@ -103,6 +192,12 @@ class CCWebgraph:
 
         self.gateway = None
         self.graph = None
+        self._util = None
+        self._j_arrays_to_string = None
+        self._j_long = None
+        self._new_array = None
+        self._labels = None
+        self._id_cache: Dict[str, int] = {}
         self._port = None
 
     @classmethod
@@ -118,7 +213,7 @@ class CCWebgraph:
 
         This is the recommended way to create a CCWebgraph instance.
         It checks Java, locates the JAR, downloads data if needed,
-        builds offsets, and loads the graph.
+        builds offsets and the label index, and loads the graph.
 
         Args:
             webgraph_dir: Directory containing webgraph files.
@@ -172,7 +267,19 @@ class CCWebgraph:
             print("Building offset files...")
             build_offsets(webgraph_dir, version, resolved_jar)
 
-        # 6. Create instance and load graph
+        # 6. Check label index (lets label lookups skip the JVM)
+        labels_ok, missing_labels = check_label_index(webgraph_dir, version)
+        if not labels_ok:
+            print(
+                "Building label index (one pass over the vertices file, "
+                "writes ~2 GB next to the graph; takes several minutes)..."
+            )
+            try:
+                build_label_index(webgraph_dir, version)
+            except ValueError as e:
+                print(f"Label index not built, using the JVM for labels: {e}")
+
+        # 7. Create instance and load graph
         instance = cls(webgraph_dir, version, resolved_jar)
         instance.load_graph()
         return instance
@@ -199,15 +306,24 @@ class CCWebgraph:
 
         print("Starting JVM with cc-webgraph...")
 
+        classpath = [self.jar_path]
+        helper_jar = find_helper_jar()
+        if helper_jar is not None:
+            classpath.append(helper_jar)
+
         self._port = launch_gateway(
-            classpath=self.jar_path,
+            classpath=os.pathsep.join(classpath),
             die_on_exit=True,
             redirect_stdout=None,
             redirect_stderr=None,
         )
 
+        # launch_gateway() starts the classic GatewayServer, so the pinned-
+        # thread ClientServer cannot attach to it. Single-threaded callers
+        # already reuse one pooled socket; eager_load opens it up front so
+        # the first query doesn't pay for the connection.
         self.gateway = JavaGateway(
-            gateway_parameters=GatewayParameters(port=self._port)
+            gateway_parameters=GatewayParameters(port=self._port, eager_load=True)
         )
 
         atexit.register(self.shutdown)
@@ -216,9 +332,54 @@ class CCWebgraph:
 
         Graph = self.gateway.jvm.org.commoncrawl.webgraph.explore.Graph
         self.graph = Graph(self.graph_base)
+        self._bind_jvm_helpers()
+        self._labels = self._open_label_index()
 
         print("Graph loaded!")
 
+    def _open_label_index(self) -> Optional[LabelIndex]:
+        """
+        Open the label index if built and consistent with the loaded graph.
+
+        An index from other vertex data would resolve every lookup to a
+        wrong ID, so it is ignored (falling back to the JVM) unless its
+        size and last label match the graph.
+        """
+        labels = LabelIndex.open(self.webgraph_dir, self.version)
+        if labels is None:
+            return None
+        try:
+            num_nodes = get_field(self.graph, "graph").numNodes()
+            matches = len(labels) == num_nodes and (
+                num_nodes == 0
+                or labels.label(num_nodes - 1)
+                == self.graph.vertexIdToLabel(num_nodes - 1)
+            )
+        except Py4JError:
+            matches = False
+        if not matches:
+            print("Label index does not match the graph; ignoring it.")
+            labels.close()
+            return None
+        return labels
+
+    def _bind_jvm_helpers(self) -> None:
+        """
+        Resolve the JVM members used on hot paths once.
+
+        Each dotted lookup on gateway.jvm is itself a py4j round trip,
+        so the bound members are cached on the instance.
+        """
+        jvm = self.gateway.jvm
+        self._j_arrays_to_string = jvm.java.util.Arrays.toString
+        self._j_long = jvm.long
+        self._new_array = self.gateway.new_array
+
+        # Batch helpers from the helpers JAR (see find_helper_jar()); when
+        # it isn't on the classpath py4j resolves the name to a JavaPackage.
+        util = jvm.org.commoncrawl.webgraph.explore.GraphUtil
+        self._util = util if isinstance(util, JavaClass) else None
+
     def shutdown(self) -> None:
         """Shutdown the JVM connection."""
         if self.gateway is not None:
@@ -228,6 +389,14 @@ class CCWebgraph:
                 pass
             self.gateway = None
             self.graph = None
+            self._util = None
+            self._j_arrays_to_string = None
+            self._j_long = None
+            self._new_array = None
+        if self._labels is not None:
+            self._labels.close()
+            self._labels = None
+        self._id_cache.clear()
 
     def _ensure_loaded(self) -> None:
         """Ensure graph is loaded."""
@@ -240,24 +409,35 @@ class CCWebgraph:
     #  Internal Helpers
     # ------------------------------------------------------------------ #
 
-    def _java_int_array_to_list(self, java_array) -> List[int]:
+    def _java_int_array_to_numpy(self, java_array) -> np.ndarray:
         """
-        Convert Java int[] to Python list via a single IPC call.
+        Convert Java int[] to a NumPy int32 array via a single IPC call.
 
-        Uses Arrays.toString() in Java and string parsing in Python
-        to avoid N separate array element accesses over the socket.
+        Ships the raw little-endian bytes via GraphUtil.intsToBytes() and
+        decodes them with np.frombuffer(). Falls back to the text path
+        when the helper is not available.
         """
-        s = str(self.gateway.jvm.java.util.Arrays.toString(java_array))
-        if s == "[]":
-            return []
-        return [int(x) for x in s[1:-1].split(", ")]
+        if self._util is not None:
+            return np.frombuffer(self._util.intsToBytes(java_array), dtype="<i4")
+        return self._java_array_to_numpy_text(java_array, np.int32)
 
-    def _java_long_array_to_list(self, java_array) -> List[int]:
-        """Convert Java long[] to Python list via a single IPC call."""
-        s = str(self.gateway.jvm.java.util.Arrays.toString(java_array))
-        if s == "[]":
-            return []
-        return [int(x) for x in s[1:-1].split(", ")]
+    def _java_long_array_to_numpy(self, java_array) -> np.ndarray:
+        """Convert Java long[] to a NumPy int64 array via a single IPC call."""
+        if self._util is not None:
+            return np.frombuffer(self._util.longsToBytes(java_array), dtype="<i8")
+        return self._java_array_to_numpy_text(java_array, np.int64)
+
+    def _java_array_to_numpy_text(self, java_array, dtype) -> np.ndarray:
+        """
+        Convert a Java int[]/long[] to a NumPy array via a single IPC call.
+
+        Uses Arrays.toString() in Java and np.fromstring() in Python to
+        avoid N separate array element accesses over the socket. Parsing
+        straight into a typed buffer skips building one Python int per
+        element.
+        """
+        s = str(self._j_arrays_to_string(java_array))
+        return np.fromstring(s[1:-1], dtype=dtype, sep=",")
 
     @staticmethod
     def _to_rev(domain: str) -> str:
@@ -266,20 +446,120 @@ class CCWebgraph:
 
     @staticmethod
     def _from_rev(label: str) -> str:
-        """Unreverse a graph label to normal domain format."""
-        return _unreverse_domain(label)
+        """
+        Unreverse a graph label to normal domain format.
+
+        Results are interned: the same domain recurs across nodes, edges
+        and queries, and interned strings share one object and compare
+        by identity in the converters' dict lookups.
+        """
+        return sys.intern(_unreverse_domain(label))
 
     def _lookup_id(self, domain: str) -> int:
         """Look up vertex ID for a normal-format domain. Returns -1 if missing."""
-        return self.graph.vertexLabelToId(self._to_rev(domain))
+        return int(self._lookup_ids([domain])[0])
+
+    def _lookup_ids(self, domains: List[str]) -> np.ndarray:
+        """
+        Look up vertex IDs for many normal-format domains.
+
+        Results are memoized per instance in an LRU cache, so repeated
+        queries over overlapping seed sets only resolve domains not seen
+        recently. Missing domains map to -1.
+        """
+        keys = [d.strip().lower() for d in domains]
+        ids: Dict[str, int] = {}
+        misses = []
+        for key in dict.fromkeys(keys):
+            vid = self._id_cache.pop(key, None)
+            if vid is None:
+                misses.append(key)
+            else:
+                # Re-insert so hits move to the most recently used end
+                self._id_cache[key] = ids[key] = vid
+
+        if misses:
+            fetched = dict(zip(misses, self._fetch_ids(misses).tolist()))
+            ids.update(fetched)
+            for key, vid in fetched.items():
+                if len(self._id_cache) >= self._ID_CACHE_SIZE:
+                    # Dicts keep insertion order: evict the least recently used
+                    del self._id_cache[next(iter(self._id_cache))]
+                self._id_cache[key] = vid
+
+        return np.array([ids[key] for key in keys], dtype=np.int64)
+
+    def _fetch_ids(self, domains: List[str]) -> np.ndarray:
+        """
+        Resolve vertex IDs for normal-format domains, bypassing the cache.
+
+        Uses the memory-mapped label index when built. Otherwise uses
+        GraphUtil.labelsToIds() to resolve all domains in one IPC call,
+        falling back to one call per domain if the helper is not
+        available. Domains containing a newline cannot be graph labels
+        and would split the joined request, so they map to -1 unsent.
+        """
+        if self._labels is not None:
+            return np.array(
+                [self._labels.lookup(self._to_rev(d)) for d in domains],
+                dtype=np.int64,
+            )
+        if self._util is None:
+            return np.array(
+                [self.graph.vertexLabelToId(self._to_rev(d)) for d in domains],
+                dtype=np.int64,
+            )
+
+        ids = np.full(len(domains), -1, dtype=np.int64)
+        sendable = [i for i, d in enumerate(domains) if "\n" not in d]
+        if not sendable:
+            return ids
+        labels = "\n".join(self._to_rev(domains[i]) for i in sendable)
+        blob = self._util.labelsToIds(self.graph, labels)
+        if len(blob) != 8 * len(sendable):
+            raise RuntimeError(
+                f"GraphUtil.labelsToIds returned {len(blob) // 8} IDs "
+                f"for {len(sendable)} labels"
+            )
+        ids[sendable] = np.frombuffer(blob, dtype="<i8")
+        return ids
 
     def _lookup_label(self, vid: int) -> Optional[str]:
         """Look up normal-format domain for a vertex ID."""
-        label = self.graph.vertexIdToLabel(vid)
+        if self._labels is not None:
+            label = self._labels.label(vid)
+        else:
+            label = self.graph.vertexIdToLabel(vid)
         if label is None:
             return None
         return self._from_rev(label)
 
+    def _lookup_labels(self, vids: List[int]) -> List[Optional[str]]:
+        """
+        Look up normal-format domains for many vertex IDs.
+
+        Reads the memory-mapped label index when built. Otherwise uses
+        GraphUtil.vertexIdsToLabels() to resolve all IDs in one IPC call,
+        falling back to one call per ID if the helper is not available.
+        Unknown IDs map to None.
+        """
+        if not vids:
+            return []
+        if self._labels is not None:
+            return [
+                self._from_rev(label) if label else None
+                for label in self._labels.labels(vids)
+            ]
+        if self._util is None:
+            return [self._lookup_label(vid) for vid in vids]
+
+        java_ids = self._to_java_long_array(vids)
+        blob = self._util.vertexIdsToLabels(self.graph, java_ids)
+        return [
+            self._from_rev(label) if label else None
+            for label in bytes(blob).decode("utf-8").split("\n")
+        ]
+
     # ------------------------------------------------------------------ #
     #  Domain <-> ID Mapping
     # ------------------------------------------------------------------ #
@@ -311,6 +591,20 @@ class CCWebgraph:
         self._ensure_loaded()
         return self._lookup_label(vid)
 
+    def ids_to_domains(self, vids: List[int]) -> List[Optional[str]]:
+        """
+        Convert many graph vertex IDs to domain names in one batch.
+
+        Args:
+            vids: Vertex IDs (e.g. IdDiscoveryResult.node_ids).
+
+        Returns:
+            Domain names in normal format, aligned with vids.
+            None for invalid IDs.
+        """
+        self._ensure_loaded()
+        return self._lookup_labels(np.asarray(vids, dtype=np.int64).tolist())
+
     def validate_seeds(
         self, seed_domains: List[str]
     ) -> Tuple[List[str], List[str]]:
@@ -324,15 +618,10 @@ class CCWebgraph:
             Tuple of (found_domains, missing_domains) in normal format.
         """
         self._ensure_loaded()
-        found = []
-        missing = []
-        for domain in seed_domains:
-            clean = domain.strip().lower()
-            vid = self._lookup_id(clean)
-            if vid >= 0:
-                found.append(clean)
-            else:
-                missing.append(clean)
+        cleaned = [d.strip().lower() for d in seed_domains]
+        vids = self._lookup_ids(cleaned).tolist()
+        found = [d for d, vid in zip(cleaned, vids) if vid >= 0]
+        missing = [d for d, vid in zip(cleaned, vids) if vid < 0]
         return found, missing
 
     # ------------------------------------------------------------------ #
@@ -354,13 +643,9 @@ class CCWebgraph:
         if vid < 0:
             return []
 
-        pred_ids = self.graph.predecessors(vid)
-        results = []
-        for i in range(len(pred_ids)):
-            label = self._lookup_label(int(pred_ids[i]))
-            if label is not None:
-                results.append(label)
-        return results
+        pred_ids = self._java_int_array_to_numpy(self.graph.predecessors(vid))
+        labels = self._lookup_labels(pred_ids.tolist())
+        return [label for label in labels if label is not None]
 
     def get_successors(self, domain: str) -> List[str]:
         """
@@ -377,13 +662,9 @@ class CCWebgraph:
         if vid < 0:
             return []
 
-        succ_ids = self.graph.successors(vid)
-        results = []
-        for i in range(len(succ_ids)):
-            label = self._lookup_label(int(succ_ids[i]))
-            if label is not None:
-                results.append(label)
-        return results
+        succ_ids = self._java_int_array_to_numpy(self.graph.successors(vid))
+        labels = self._lookup_labels(succ_ids.tolist())
+        return [label for label in labels if label is not None]
 
     def shared_predecessors(
         self, domains: List[str], min_shared: Optional[int] = None
@@ -441,28 +722,94 @@ class CCWebgraph:
 
     def _domains_to_java_ids(self, domains: List[str]):
         """Convert normal-format domain list to Java long[] for shared* methods."""
-        py_ids = []
-        for d in domains:
-            vid = self._lookup_id(d)
-            if vid >= 0:
-                py_ids.append(int(vid))
+        py_ids = [vid for vid in self._lookup_ids(domains).tolist() if vid >= 0]
         if not py_ids:
             return None
+        return self._to_java_long_array(py_ids)
 
-        java_ids = self.gateway.new_array(self.gateway.jvm.long, len(py_ids))
+    def _to_java_long_array(self, py_ids: List[int]):
+        """
+        Copy a list of vertex IDs into a new Java long[].
+
+        Ships the IDs as one little-endian byte blob via
+        GraphUtil.bytesToLongArray(); without the helper every element
+        assignment is a separate py4j call.
+        """
+        if self._util is not None:
+            buf = np.asarray(py_ids, dtype="<i8").tobytes()
+            return self._util.bytesToLongArray(buf)
+
+        java_ids = self._new_array(self._j_long, len(py_ids))
         for i, vid in enumerate(py_ids):
             java_ids[i] = vid
         return java_ids
 
+    def _neighbors_batch(
+        self, seed_ids: List[int], backlinks: bool
+    ) -> List[np.ndarray]:
+        """
+        Fetch neighbor ID arrays for several vertices.
+
+        Uses GraphUtil.neighborsBatch() to fetch all lists in one IPC call,
+        which returns them as a single length-prefixed int[]. Falls back to
+        one predecessors()/successors() call per vertex if the helper is
+        not available in the loaded JAR.
+        """
+        if self._util is None:
+            fetch = self.graph.predecessors if backlinks else self.graph.successors
+            return [self._java_int_array_to_numpy(fetch(vid)) for vid in seed_ids]
+
+        java_ids = self._to_java_long_array(seed_ids)
+        flat = self._java_int_array_to_numpy(
+            self._util.neighborsBatch(self.graph, java_ids, backlinks)
+        )
+        arrays = []
+        pos = 0
+        while pos < len(flat):
+            n = int(flat[pos])
+            arrays.append(flat[pos + 1:pos + 1 + n])
+            pos += n + 1
+        return arrays
+
+    def _aggregate_neighbors(
+        self, seed_ids: List[int], min_connections: int, backlinks: bool
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """
+        Count and filter the neighbors of a seed set.
+
+        Runs the whole aggregation in Java via GraphUtil.discover(), so
+        neither neighbor lists nor per-edge work cross the py4j bridge.
+        Without the helper, neighbor arrays are fetched and aggregated
+        in Python by _count_neighbors().
+
+        Returns:
+            Tuple of (neighbor_ids, counts, edge_seed_idx, num_unique),
+            as documented on _count_neighbors().
+        """
+        if self._util is None:
+            neighbor_arrays = self._neighbors_batch(seed_ids, backlinks)
+            return _count_neighbors(
+                neighbor_arrays,
+                np.asarray(seed_ids, dtype=np.int64),
+                min_connections,
+            )
+
+        java_ids = self._to_java_long_array(seed_ids)
+        data = np.frombuffer(
+            self._util.discover(self.graph, java_ids, min_connections, backlinks),
+            dtype="<i8",
+        )
+        num_unique, n, e = data[:3].tolist()
+        neighbor_ids = data[3:3 + n]
+        counts = data[3 + n:3 + 2 * n]
+        edge_seed_idx = data[3 + 2 * n:3 + 2 * n + e]
+        return neighbor_ids, counts, edge_seed_idx, num_unique
+
     def _resolve_long_array(self, java_array) -> List[str]:
         """Convert Java long[] result IDs to normal-format domain name list."""
-        id_list = self._java_long_array_to_list(java_array)
-        results = []
-        for vid in id_list:
-            label = self._lookup_label(vid)
-            if label is not None:
-                results.append(label)
-        return results
+        id_list = self._java_long_array_to_numpy(java_array)
+        labels = self._lookup_labels(id_list.tolist())
+        return [label for label in labels if label is not None]
 
     # ------------------------------------------------------------------ #
     #  Discovery
@@ -474,7 +821,8 @@ class CCWebgraph:
         min_connections: int = 1,
         direction: str = "backlinks",
         format: str = "edges",
-    ) -> Union[DiscoveryResult, object]:
+        return_ids: bool = False,
+    ) -> Union[DiscoveryResult, IdDiscoveryResult, object]:
         """
         Discover domains connected to seed domains.
 
@@ -493,86 +841,97 @@ class CCWebgraph:
                 - 'networkx': Returns nx.DiGraph directly.
                 - 'networkit': Returns (nk.Graph, name_map) directly.
                 - 'igraph': Returns ig.Graph directly.
+            return_ids: If True, skip label resolution and return an
+                IdDiscoveryResult of raw vertex IDs (format='edges'), or
+                (nk.Graph, id_map) for format='networkit'. Other formats
+                are not supported with return_ids.
 
         Returns:
             DiscoveryResult (format='edges') or graph object for other formats.
             All domain names in normal format.
         """
         self._ensure_loaded()
+        if return_ids and format not in ("edges", "networkit"):
+            raise ValueError(
+                f"format={format!r} is not supported with return_ids=True; "
+                "use 'edges' or 'networkit'"
+            )
 
         # Validate seeds (convert to reversed internally)
-        valid_seeds = []  # normal format
-        seed_ids = []
-        for domain in seed_domains:
-            clean = domain.strip().lower()
-            vid = self._lookup_id(clean)
-            if vid >= 0:
-                valid_seeds.append(clean)
-                seed_ids.append(int(vid))
+        cleaned = [d.strip().lower() for d in seed_domains]
+        vids = self._lookup_ids(cleaned).tolist()
+        valid_seeds = [d for d, vid in zip(cleaned, vids) if vid >= 0]
+        seed_ids = [vid for vid in vids if vid >= 0]
 
         if not seed_ids:
             print("No valid seed domains found in graph.")
+            if return_ids:
+                empty = np.empty(0, dtype=np.int64)
+                return IdDiscoveryResult(
+                    empty, empty, empty.reshape(0, 2), empty, []
+                )
             return DiscoveryResult(nodes=[], edges=[], seeds=[])
 
         print(f"Processing {len(seed_ids)} seed domains...")
-        seed_id_set = set(seed_ids)
-        seed_id_to_domain = dict(zip(seed_ids, valid_seeds))
 
-        # Count connections and track which seeds connect to each neighbor
-        neighbor_counts: Dict[int, int] = {}
-        neighbor_seed_ids: Dict[int, List[int]] = {}
+        # Count connections and track which seeds connect to each neighbor,
+        # keeping only neighbors that meet the threshold
+        neighbor_ids, counts, edge_seed_idx, num_unique = self._aggregate_neighbors(
+            seed_ids, min_connections, backlinks=(direction == "backlinks")
+        )
+        print(f"Found {num_unique:,} unique neighbor domains")
 
-        for i, seed_id in enumerate(seed_ids):
+        if return_ids:
+            seed_id_arr = np.asarray(seed_ids, dtype=np.int64)
+            edge_neighbor_ids = np.repeat(neighbor_ids, counts)
+            edge_seed_ids = seed_id_arr[edge_seed_idx]
             if direction == "backlinks":
-                java_neighbors = self.graph.predecessors(seed_id)
+                pairs = (edge_neighbor_ids, edge_seed_ids)
             else:
-                java_neighbors = self.graph.successors(seed_id)
-
-            neighbors = self._java_int_array_to_list(java_neighbors)
-
-            for nid in neighbors:
-                if nid not in seed_id_set:
-                    neighbor_counts[nid] = neighbor_counts.get(nid, 0) + 1
-                    if nid not in neighbor_seed_ids:
-                        neighbor_seed_ids[nid] = []
-                    neighbor_seed_ids[nid].append(seed_id)
-
-            if (i + 1) % 100 == 0 or i == len(seed_ids) - 1:
-                print(f"\rProcessed {i + 1}/{len(seed_ids)} seeds...", end="")
-
-        print()
-        print(f"Found {len(neighbor_counts):,} unique neighbor domains")
+                pairs = (edge_seed_ids, edge_neighbor_ids)
+            order = np.argsort(-counts, kind="stable")
+            id_result = IdDiscoveryResult(
+                node_ids=neighbor_ids[order],
+                counts=counts[order],
+                edge_ids=np.stack(pairs, axis=1),
+                seed_ids=seed_id_arr,
+                seeds=valid_seeds,
+            )
+            print(f"Found {len(id_result):,} domains with >= {min_connections} connections")
+            if format == "networkit":
+                return id_result.networkit()
+            return id_result
+
+        # Resolve labels (normal format) and drop IDs without one
+        domains = np.array(
+            self._lookup_labels(neighbor_ids.tolist()), dtype=object
+        )
+        resolved = domains.astype(bool)
+        edge_node_idx = np.repeat(np.arange(len(domains)), counts)
+        edge_keep = resolved[edge_node_idx]
+
+        edge_node_idx = edge_node_idx[edge_keep]
+        edge_seed_idx = edge_seed_idx[edge_keep]
+        build_edges = _EdgeBuilder(
+            domains, valid_seeds, direction == "backlinks",
+            domain_idx=edge_node_idx, seed_idx=edge_seed_idx,
+        )
 
-        # Filter and build results (unreverse all domain names)
-        nodes = []
-        edges = []
+        # Build nodes sorted by connections, descending
         num_seeds = len(seed_ids)
-
-        for nid, count in neighbor_counts.items():
-            if count < min_connections:
-                continue
-            domain = self._lookup_label(nid)
-            if not domain:
-                continue
-
-            nodes.append({
-                "domain": domain,
-                "connections": count,
-                "percentage": round(count * 100.0 / num_seeds, 2),
-            })
-
-            # Build edges from this neighbor to/from its connected seeds
-            for sid in neighbor_seed_ids[nid]:
-                seed_domain = seed_id_to_domain[sid]
-                if direction == "backlinks":
-                    edges.append((domain, seed_domain))
-                else:
-                    edges.append((seed_domain, domain))
-
-        nodes.sort(key=lambda x: x["connections"], reverse=True)
-        print(f"Found {len(nodes):,} domains with >= {min_connections} connections")
-
-        result = DiscoveryResult(nodes=nodes, edges=edges, seeds=valid_seeds)
+        node_counts = counts[resolved]
+        order = np.argsort(-node_counts, kind="stable")
+        node_counts = node_counts[order]
+        percentages = np.round(node_counts * 100.0 / num_seeds, 2)
+        node_domains = domains[resolved][order].tolist()
+
+        print(f"Found {len(node_domains):,} domains with >= {min_connections} connections")
+
+        result = DiscoveryResult.from_columns(
+            node_domains, node_counts, percentages,
+            seeds=valid_seeds, edges_builder=build_edges,
+            num_edges=len(edge_seed_idx),
+        )
 
         if format == "networkx":
             return result.networkx()
@@ -640,10 +999,14 @@ class CCWebgraph:
         domains = self.shared_successors(seeds, min_shared=min_connections)
         seed_set = set(s.strip().lower() for s in seeds)
         domains = [d for d in domains if d not in seed_set]
-        nodes = [{"domain": d, "connections": 0, "percentage": 0.0}
-                 for d in domains]
-        edges = [(s, d) for d in domains for s in seed_set]
-        return DiscoveryResult(nodes=nodes, edges=edges, seeds=list(seed_set))
+        return DiscoveryResult.from_columns(
+            domains,
+            np.zeros(len(domains), dtype=np.int64),
+            np.zeros(len(domains)),
+            seeds=list(seed_set),
+            num_edges=len(domains) * len(seed_set),
+            edges_builder=_EdgeBuilder(domains, list(seed_set), backlinks=False),
+        )
 
     def shared_backlinks(
         self,
@@ -665,10 +1028,14 @@ class CCWebgraph:
         domains = self.shared_predecessors(seeds, min_shared=min_connections)
         seed_set = set(s.strip().lower() for s in seeds)
         domains = [d for d in domains if d not in seed_set]
-        nodes = [{"domain": d, "connections": 0, "percentage": 0.0}
-                 for d in domains]
-        edges = [(d, s) for d in domains for s in seed_set]
-        return DiscoveryResult(nodes=nodes, edges=edges, seeds=list(seed_set))
+        return DiscoveryResult.from_columns(
+            domains,
+            np.zeros(len(domains), dtype=np.int64),
+            np.zeros(len(domains)),
+            seeds=list(seed_set),
+            num_edges=len(domains) * len(seed_set),
+            edges_builder=_EdgeBuilder(domains, list(seed_set), backlinks=True),
+        )
 
     # ------------------------------------------------------------------ #
     #  Edge Lookup
@@ -709,12 +1076,12 @@ class CCWebgraph:
         self._ensure_loaded()
 
         # Build target ID set for O(1) lookup
-        target_id_to_domain: Dict[int, str] = {}
-        for domain in domains_to:
-            clean = domain.strip().lower()
-            vid = self._lookup_id(clean)
-            if vid >= 0:
-                target_id_to_domain[vid] = clean
+        targets = [d.strip().lower() for d in domains_to]
+        target_id_to_domain: Dict[int, str] = {
+            vid: d
+            for d, vid in zip(targets, self._lookup_ids(targets).tolist())
+            if vid >= 0
+        }
         target_ids = set(target_id_to_domain.keys())
 
         if not target_ids:
@@ -722,19 +1089,17 @@ class CCWebgraph:
 
         # For each source, get successors and intersect with targets
         edges: List[Tuple[str, str]] = []
+        sources = [d.strip().lower() for d in domains_from]
 
-        for domain in domains_from:
-            clean = domain.strip().lower()
-            source_id = self._lookup_id(clean)
-            if source_id < 0:
-                continue
-
-            # Get all outlinks from this source
-            java_successors = self.graph.successors(source_id)
-            successor_ids = self._java_int_array_to_list(java_successors)
+        source_ids = self._lookup_ids(sources).tolist()
+        found = [(clean, sid) for clean, sid in zip(sources, source_ids) if sid >= 0]
+        successor_arrays = self._neighbors_batch(
+            [sid for _, sid in found], backlinks=False
+        )
 
+        for (clean, _), successor_ids in zip(found, successor_arrays):
             # Set intersection - O(min(N, S)) instead of O(S)
-            matching_ids = target_ids & set(successor_ids)
+            matching_ids = target_ids & set(successor_ids.tolist())
             for match_id in matching_ids:
                 edges.append((clean, target_id_to_domain[match_id]))
 
@@ -5,7 +5,44 @@ Converts discovery results (node lists + edge lists) into
 NetworkX, NetworKit, igraph, or pandas formats.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class _EdgeBuilder:
+    """
+    Picklable edges_builder pairing discovered domains with their seeds.
+
+    Holds only the index arrays, so a result can be pickled (for
+    multiprocessing or joblib) before its edges are ever built. With no
+    index arrays, every domain is paired with every seed.
+    """
+
+    def __init__(
+        self,
+        domains,
+        seeds: List[str],
+        backlinks: bool,
+        domain_idx: Optional[np.ndarray] = None,
+        seed_idx: Optional[np.ndarray] = None,
+    ):
+        self.domains = domains
+        self.seeds = seeds
+        self.backlinks = backlinks
+        self.domain_idx = domain_idx
+        self.seed_idx = seed_idx
+
+    def __call__(self) -> List[Tuple[str, str]]:
+        if self.domain_idx is None:
+            domain_side = [d for d in self.domains for _ in self.seeds]
+            seed_side = list(self.seeds) * len(self.domains)
+        else:
+            domain_side = np.asarray(self.domains, dtype=object)[self.domain_idx].tolist()
+            seed_side = np.asarray(self.seeds, dtype=object)[self.seed_idx].tolist()
+        if self.backlinks:
+            return list(zip(domain_side, seed_side))
+        return list(zip(seed_side, domain_side))
 
 
 class DiscoveryResult:
@@ -20,18 +57,137 @@ class DiscoveryResult:
                Sorted by connections descending.
         edges: List of (source, target) domain name tuples.
         seeds: List of seed domain names used in the query.
+
+    A result built from node dicts keeps that list as its source of
+    truth: edits to it are seen by len() and every conversion. Results
+    from from_columns() (as returned by discover()) store node data as
+    parallel arrays instead, and only build the dicts the first time
+    .nodes is read; from then on that list is the source of truth.
+
+    Edges can be supplied lazily via edges_builder, a zero-argument
+    callable that is invoked the first time .edges is accessed. Large
+    queries whose callers only read .nodes then never pay for them.
+    Pass num_edges alongside a builder so repr() can report the edge
+    count without building them. The builder is pickled with the result,
+    so it must be picklable (not a lambda or closure) for the result to be.
     """
 
     def __init__(
         self,
         nodes: List[Dict],
-        edges: List[Tuple[str, str]],
+        edges: Optional[List[Tuple[str, str]]],
         seeds: List[str],
+        edges_builder: Optional[Callable[[], List[Tuple[str, str]]]] = None,
+        num_edges: Optional[int] = None,
     ):
         self.nodes = nodes
-        self.edges = edges
+        self._edges = edges
+        self._edges_builder = edges_builder
+        self._num_edges = num_edges
         self.seeds = seeds
 
+    @classmethod
+    def from_columns(
+        cls,
+        domains: List[str],
+        connections,
+        percentages,
+        seeds: List[str],
+        edges: Optional[List[Tuple[str, str]]] = None,
+        edges_builder: Optional[Callable[[], List[Tuple[str, str]]]] = None,
+        num_edges: Optional[int] = None,
+    ) -> "DiscoveryResult":
+        """
+        Build a result from parallel node columns, without creating dicts.
+
+        Counts are stored as int32 and percentages as float32, which
+        halves the columns' memory; percentages are expected to be
+        rounded to two decimals, as discover() produces them.
+
+        Args:
+            domains: Node domain names.
+            connections: Seed connection counts, aligned with domains.
+            percentages: Percentage of seeds connected, aligned with domains.
+            seeds: Seed domain names used in the query.
+            edges: Optional list of (source, target) domain name tuples.
+            edges_builder: Optional callable producing edges on first access.
+            num_edges: Number of edges edges_builder will produce, if known.
+        """
+        result = cls.__new__(cls)
+        result._nodes = None
+        result._columns = (
+            list(domains),
+            np.asarray(connections, dtype=np.int32),
+            np.asarray(percentages, dtype=np.float32),
+        )
+        result._df = None
+        result._edges = edges
+        result._edges_builder = edges_builder
+        result._num_edges = num_edges
+        result.seeds = seeds
+        return result
+
+    @property
+    def nodes(self) -> List[Dict]:
+        """
+        Node dicts. Column-backed results build the list on first access
+        and switch to it, so later edits are seen like for any other result.
+        """
+        if self._columns is not None:
+            domains, connections, _ = self._columns
+            self.nodes = [
+                {"domain": domain, "connections": count, "percentage": pct}
+                for domain, count, pct in zip(
+                    domains, connections.tolist(), self._percentage_values()
+                )
+            ]
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, value: List[Dict]) -> None:
+        self._nodes = value
+        self._columns = None
+        self._df = None
+
+    @property
+    def domains(self) -> List[str]:
+        """Node domain names, sorted by connections descending."""
+        if self._columns is None:
+            return [n["domain"] for n in self._nodes]
+        return self._columns[0]
+
+    @property
+    def connections(self) -> np.ndarray:
+        """Seed connection counts, aligned with domains."""
+        if self._columns is None:
+            return np.asarray([n["connections"] for n in self._nodes], dtype=np.int64)
+        return self._columns[1]
+
+    @property
+    def percentages(self) -> np.ndarray:
+        """Percentage of seeds connected, aligned with domains."""
+        if self._columns is None:
+            return np.asarray([n["percentage"] for n in self._nodes], dtype=np.float64)
+        return self._columns[2]
+
+    def _percentage_values(self) -> List[float]:
+        # Undo float32 widening noise (66.67 -> 66.66999816894531);
+        # column-backed results only ever hold two-decimal percentages
+        return [round(pct, 2) for pct in self._columns[2].tolist()]
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        """List of (source, target) domain name tuples, built on first access."""
+        if self._edges is None:
+            self._edges = self._edges_builder() if self._edges_builder else []
+            self._edges_builder = None
+        return self._edges
+
+    @edges.setter
+    def edges(self, value: List[Tuple[str, str]]) -> None:
+        self._edges = value
+        self._edges_builder = None
+
     def __getitem__(self, key):
         """Dict-like access: result['nodes'], result['edges'], result['seeds']."""
         if key == "nodes":
@@ -43,12 +199,23 @@ class DiscoveryResult:
         raise KeyError(key)
 
     def __len__(self):
-        return len(self.nodes)
+        if self._columns is None:
+            return len(self._nodes)
+        return len(self._columns[0])
 
     def __repr__(self):
+        # Never force the edges builder just to print a summary
+        if self._edges is not None:
+            edges = f"{len(self._edges)} edges"
+        elif self._edges_builder is None:
+            edges = "0 edges"
+        elif self._num_edges is not None:
+            edges = f"{self._num_edges} edges"
+        else:
+            edges = "edges not built"
         return (
-            f"DiscoveryResult({len(self.nodes)} nodes, "
-            f"{len(self.edges)} edges, {len(self.seeds)} seeds)"
+            f"DiscoveryResult({len(self)} nodes, "
+            f"{edges}, {len(self.seeds)} seeds)"
         )
 
     def networkx(self):
@@ -62,7 +229,12 @@ class DiscoveryResult:
             Seed nodes have attribute is_seed=True.
             Discovered nodes have attributes: connections, percentage.
         """
-        return to_networkx(self.nodes, self.edges, self.seeds)
+        if self._columns is None:
+            return to_networkx(self._nodes, self.edges, self.seeds)
+        domains, connections, _ = self._columns
+        return _to_networkx(
+            domains, connections, self._percentage_values(), self.edges, self.seeds
+        )
 
     def networkit(self):
         """
@@ -74,7 +246,7 @@ class DiscoveryResult:
             Tuple of (nk.Graph, name_map) where name_map is
             {domain_name: node_id}.
         """
-        return to_networkit(self.nodes, self.edges, self.seeds)
+        return _to_networkit(self.domains, self.edges, self.seeds)
 
     def igraph(self):
         """
@@ -85,7 +257,10 @@ class DiscoveryResult:
         Returns:
             ig.Graph with domain names as vertex 'name' attribute.
         """
-        return to_igraph(self.nodes, self.edges, self.seeds)
+        if self._columns is None:
+            return to_igraph(self._nodes, self.edges, self.seeds)
+        domains, connections, _ = self._columns
+        return _to_igraph(domains, connections, self.edges, self.seeds)
 
     def to_dataframe(self):
         """
@@ -94,7 +269,10 @@ class DiscoveryResult:
         Requires: pip install pandas
 
         Returns:
-            DataFrame with columns: domain, connections, percentage.
+            DataFrame with columns: domain, connections, percentage, plus
+            any extra keys present in the node dicts. Column-backed results
+            use int32/float32 columns. Each call returns a fresh frame, so
+            it is safe to modify.
         """
         try:
             import pandas as pd
@@ -103,7 +281,111 @@ class DiscoveryResult:
                 "pandas is required for to_dataframe(). "
                 "Install with: pip install pyccwebgraph[pandas]"
             )
-        return pd.DataFrame(self.nodes)
+        if self._columns is None:
+            if not self._nodes:
+                return pd.DataFrame(columns=["domain", "connections", "percentage"])
+            return pd.DataFrame(self._nodes)
+        # Built straight from the columns and cached; the columns never change
+        if self._df is None:
+            domains, connections, percentages = self._columns
+            self._df = pd.DataFrame({
+                "domain": domains,
+                "connections": connections,
+                "percentage": percentages,
+            })
+        return self._df.copy()
+
+
+class IdDiscoveryResult:
+    """
+    Result of a discovery query in raw vertex IDs.
+
+    Returned by CCWebgraph.discover(..., return_ids=True). No labels are
+    resolved, which saves the label lookup for callers that re-encode
+    the graph anyway. Use CCWebgraph.ids_to_domains() to name only the
+    vertices of interest.
+
+    Attributes:
+        node_ids: int64 array of discovered vertex IDs.
+                  Sorted by connections descending.
+        counts: int64 array of seed connections, aligned with node_ids.
+        edge_ids: (E, 2) int64 array of (source, target) vertex IDs.
+        seed_ids: int64 array of seed vertex IDs.
+        seeds: List of seed domain names, aligned with seed_ids.
+    """
+
+    def __init__(
+        self,
+        node_ids: np.ndarray,
+        counts: np.ndarray,
+        edge_ids: np.ndarray,
+        seed_ids: np.ndarray,
+        seeds: List[str],
+    ):
+        self.node_ids = node_ids
+        self.counts = counts
+        self.edge_ids = edge_ids
+        self.seed_ids = seed_ids
+        self.seeds = seeds
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def __repr__(self):
+        return (
+            f"IdDiscoveryResult({len(self.node_ids)} nodes, "
+            f"{len(self.edge_ids)} edges, {len(self.seed_ids)} seeds)"
+        )
+
+    @property
+    def percentages(self) -> np.ndarray:
+        """Percentage of seeds each node is connected to, aligned with node_ids."""
+        if len(self.seed_ids) == 0:
+            return np.zeros(len(self.counts))
+        return np.round(self.counts * 100.0 / len(self.seed_ids), 2)
+
+    def networkit(self):
+        """
+        Convert to NetworKit graph.
+
+        Requires: pip install networkit
+
+        Returns:
+            Tuple of (nk.Graph, id_map) where id_map is
+            {vertex_id: node_id}.
+        """
+        return ids_to_networkit(self.node_ids, self.edge_ids, self.seed_ids)
+
+
+def _node_columns(nodes: List[Dict]) -> Tuple[List[str], List[int], List[float]]:
+    """Split a list of node dicts into (domains, connections, percentages)."""
+    return (
+        [n["domain"] for n in nodes],
+        [n["connections"] for n in nodes],
+        [n["percentage"] for n in nodes],
+    )
+
+
+def _build_name_map(
+    domains: List[str],
+    edges: List[Tuple[str, str]],
+    seeds: Optional[List[str]] = None,
+) -> Dict[str, int]:
+    """
+    Assign a dense integer ID to every domain, in first-seen order.
+
+    Discovered nodes come first, then seeds, then any domain that only
+    appears in edges. IDs are arbitrary, so no sort is needed.
+    """
+    name_map: Dict[str, int] = {}
+    for domain in domains:
+        name_map.setdefault(domain, len(name_map))
+    for seed in seeds or ():
+        name_map.setdefault(seed, len(name_map))
+    for src, tgt in edges:
+        name_map.setdefault(src, len(name_map))
+        name_map.setdefault(tgt, len(name_map))
+    return name_map
 
 
 def to_networkx(
@@ -122,6 +404,10 @@ def to_networkx(
     Returns:
         nx.DiGraph
     """
+    return _to_networkx(*_node_columns(nodes), edges, seeds)
+
+
+def _to_networkx(domains, connections, percentages, edges, seeds):
     try:
         import networkx as nx
     except ImportError:
@@ -134,17 +420,18 @@ def to_networkx(
     seed_set = set(seeds) if seeds else set()
 
     # Add seed nodes
-    for seed in seed_set:
-        G.add_node(seed, is_seed=True)
-
-    # Add discovered nodes with attributes
-    for node in nodes:
-        G.add_node(
-            node["domain"],
-            connections=node["connections"],
-            percentage=node["percentage"],
-            is_seed=node["domain"] in seed_set,
+    G.add_nodes_from(seed_set, is_seed=True)
+
+    # Add discovered nodes with attributes, in one bulk call
+    G.add_nodes_from(
+        (
+            domain,
+            {"connections": count, "percentage": pct, "is_seed": domain in seed_set},
+        )
+        for domain, count, pct in zip(
+            domains, np.asarray(connections).tolist(), np.asarray(percentages).tolist()
         )
+    )
 
     # Add edges
     G.add_edges_from(edges)
@@ -168,6 +455,10 @@ def to_networkit(
     Returns:
         Tuple of (nk.Graph, name_map) where name_map maps domain -> node_id.
     """
+    return _to_networkit([n["domain"] for n in nodes], edges, seeds)
+
+
+def _to_networkit(domains, edges, seeds):
     try:
         import networkit as nk
     except ImportError:
@@ -176,17 +467,7 @@ def to_networkit(
             "Install with: pip install pyccwebgraph[networkit]"
         )
 
-    # Build name -> id mapping
-    all_domains = set()
-    for node in nodes:
-        all_domains.add(node["domain"])
-    if seeds:
-        all_domains.update(seeds)
-    for src, tgt in edges:
-        all_domains.add(src)
-        all_domains.add(tgt)
-
-    name_map = {domain: i for i, domain in enumerate(sorted(all_domains))}
+    name_map = _build_name_map(domains, edges, seeds)
 
     G = nk.Graph(len(name_map), directed=True)
     for src, tgt in edges:
@@ -211,6 +492,11 @@ def to_igraph(
     Returns:
         ig.Graph with vertex 'name' attributes.
     """
+    domains, connections, _ = _node_columns(nodes)
+    return _to_igraph(domains, connections, edges, seeds)
+
+
+def _to_igraph(domains, node_connections, edges, seeds):
     try:
         import igraph as ig
     except ImportError:
@@ -219,18 +505,8 @@ def to_igraph(
             "Install with: pip install pyccwebgraph[igraph]"
         )
 
-    # Collect all unique domain names
-    all_domains = set()
-    for node in nodes:
-        all_domains.add(node["domain"])
-    if seeds:
-        all_domains.update(seeds)
-    for src, tgt in edges:
-        all_domains.add(src)
-        all_domains.add(tgt)
-
-    domain_list = sorted(all_domains)
-    name_to_idx = {d: i for i, d in enumerate(domain_list)}
+    name_to_idx = _build_name_map(domains, edges, seeds)
+    domain_list = list(name_to_idx)
 
     G = ig.Graph(n=len(domain_list), directed=True)
     G.vs["name"] = domain_list
@@ -240,13 +516,68 @@ def to_igraph(
     G.vs["is_seed"] = [d in seed_set for d in domain_list]
 
     # Add connection data for discovered nodes
-    node_lookup = {n["domain"]: n for n in nodes}
-    G.vs["connections"] = [
-        node_lookup.get(d, {}).get("connections", 0) for d in domain_list
-    ]
-
-    # Add edges
-    edge_list = [(name_to_idx[s], name_to_idx[t]) for s, t in edges]
-    G.add_edges(edge_list)
+    connections = np.zeros(len(domain_list), dtype=np.int64)
+    connections[[name_to_idx[d] for d in domains]] = node_connections
+    G.vs["connections"] = connections.tolist()
+
+    # Add edges as an (E, 2) index array
+    srcs = np.fromiter(
+        (name_to_idx[s] for s, _ in edges), dtype=np.int32, count=len(edges)
+    )
+    tgts = np.fromiter(
+        (name_to_idx[t] for _, t in edges), dtype=np.int32, count=len(edges)
+    )
+    G.add_edges(np.stack([srcs, tgts], axis=1))
 
     return G
+
+
+def ids_to_networkit(
+    node_ids: np.ndarray,
+    edge_ids: np.ndarray,
+    seed_ids: Optional[np.ndarray] = None,
+) -> tuple:
+    """
+    Convert ID-based discovery results to a NetworKit graph.
+
+    Vertex IDs are remapped to dense node IDs with one np.unique call and
+    edges are inserted in bulk, without any string handling.
+
+    Args:
+        node_ids: Discovered vertex IDs.
+        edge_ids: (E, 2) array of (source, target) vertex IDs.
+        seed_ids: Optional seed vertex IDs.
+
+    Returns:
+        Tuple of (nk.Graph, id_map) where id_map maps vertex_id -> node_id.
+    """
+    try:
+        import networkit as nk
+    except ImportError:
+        raise ImportError(
+            "NetworKit is required for networkit output. "
+            "Install with: pip install pyccwebgraph[networkit]"
+        )
+
+    if seed_ids is None:
+        seed_ids = np.empty(0, dtype=np.int64)
+    edge_ids = np.asarray(edge_ids, dtype=np.int64).reshape(-1, 2)
+    all_ids = np.concatenate([
+        np.asarray(node_ids, dtype=np.int64),
+        np.asarray(seed_ids, dtype=np.int64),
+        edge_ids.ravel(),
+    ])
+    unique_ids, inverse = np.unique(all_ids, return_inverse=True)
+    local_edges = inverse[len(all_ids) - edge_ids.size:].reshape(-1, 2)
+
+    G = nk.Graph(len(unique_ids), directed=True)
+    if hasattr(G, "addEdges"):
+        srcs = np.ascontiguousarray(local_edges[:, 0], dtype=np.uint64)
+        tgts = np.ascontiguousarray(local_edges[:, 1], dtype=np.uint64)
+        G.addEdges((srcs, tgts))
+    else:
+        for src, tgt in local_edges.tolist():
+            G.addEdge(src, tgt)
+
+    id_map = dict(zip(unique_ids.tolist(), range(len(unique_ids))))
+    return G, id_map
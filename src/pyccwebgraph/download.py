@@ -7,16 +7,21 @@ and listing available webgraph versions.
 
 import os
 import subprocess
-import urllib.request
-from typing import List, Optional
+from collections import deque
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Deque, List, Optional, Tuple
 
-from .setup_utils import get_required_files, find_jar
+from .setup_utils import get_required_files, find_jar, total_ram_bytes
 
-try:
-    from tqdm.auto import tqdm
-    HAS_TQDM = True
-except ImportError:
-    HAS_TQDM = False
+if TYPE_CHECKING:
+    import urllib3
+
+# tqdm.auto is slow to import (notebook detection), so it is loaded on
+# the first download rather than with the package; urllib3 likewise is
+# imported inside the functions that download
+_tqdm = None
 
 
 # Known webgraph versions (newest first)
@@ -28,6 +33,32 @@ KNOWN_VERSIONS = [
     "cc-main-2022-nov-dec-jan",
 ]
 
+# Read size for streamed downloads
+CHUNK_SIZE = 4 << 20
+
+# Bytes written between hints to drop a download from the page cache
+FADVISE_INTERVAL = 64 << 20
+
+# Upper bound on concurrent file downloads
+MAX_DOWNLOAD_WORKERS = 6
+
+# Seconds to wait for a connection, and for each read on it; a stalled
+# socket then raises and is retried instead of hanging the download
+CONNECT_TIMEOUT = 30
+READ_TIMEOUT = 60
+
+# Resume attempts after a dropped connection, and the initial delay in
+# seconds between them (doubled on each attempt)
+MAX_RETRIES = 5
+RETRY_BACKOFF = 1.0
+
+# Seconds allowed for one BVGraph offsets build
+OFFSETS_TIMEOUT = 300
+
+# Process-wide connection pool, created on first download
+_pool: Optional["urllib3.PoolManager"] = None
+_pool_lock = threading.Lock()
+
 
 def get_available_versions() -> List[str]:
     """
@@ -39,30 +70,356 @@ def get_available_versions() -> List[str]:
     return list(KNOWN_VERSIONS)
 
 
-def download_with_progress(url: str, dest_path: str) -> None:
-    """Download a file with progress bar if tqdm is available."""
-    if os.path.exists(dest_path):
-        size_mb = os.path.getsize(dest_path) / (1024 * 1024)
-        print(f"  Already exists: {os.path.basename(dest_path)} ({size_mb:.1f} MB)")
-        return
+def _get_tqdm():
+    """Return the tqdm class, or None if tqdm is not installed."""
+    global _tqdm
+    if _tqdm is None:
+        try:
+            from tqdm.auto import tqdm
+        except ImportError:
+            tqdm = False
+        _tqdm = tqdm
+    return _tqdm or None
+
+
+def _get_pool(maxsize: int = 1) -> "urllib3.PoolManager":
+    """
+    Return the shared connection pool, creating it on first use.
+
+    All webgraph files come from data.commoncrawl.org, so keeping one
+    pool for the process lets later downloads (and later versions) reuse
+    its keep-alive connections instead of repeating the TLS handshake.
+    The pool is rebuilt if a caller needs more concurrent connections
+    than it was sized for.
+    """
+    import urllib3
+
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.connection_pool_kw.get("maxsize", 1) < maxsize:
+            if _pool is not None:
+                _pool.clear()
+            _pool = urllib3.PoolManager(num_pools=4, maxsize=maxsize)
+        return _pool
+
+
+def _fadvise(fd: int, advice: str) -> None:
+    """Apply a posix_fadvise hint to a whole file where supported."""
+    if hasattr(os, advice):
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+
+
+def _plan_resume(
+    status: int,
+    headers,
+    start: int,
+    url: str,
+) -> Optional[Tuple[bool, int, Optional[int]]]:
+    """
+    Interpret the response to a (possibly ranged) download request.
+
+    A 206 response is appended to the part file, a 200 (server ignored
+    the range) restarts it, and a 416 means the part file already holds
+    the whole resource.
+
+    Returns:
+        None if the part file is already complete, otherwise a tuple of
+        (append, start, total) where total is the full size in bytes if
+        known.
+    """
+    if status == 416 and start:
+        return None
+    if status == 206:
+        append = True
+    elif status == 200:
+        start, append = 0, False
+    else:
+        raise RuntimeError(f"Failed to download {url}: HTTP {status}")
+
+    # Content-Range is "bytes <first>-<last>/<total>"
+    total = None
+    content_range = headers.get("Content-Range", "")
+    if "/" in content_range and not content_range.endswith("/*"):
+        total = int(content_range.rsplit("/", 1)[1])
+    elif headers.get("Content-Length"):
+        total = start + int(headers["Content-Length"])
+    return append, start, total
+
+
+class _PartWriter:
+    """
+    Raw-fd writer for a .part file, with progress bar and cache hints.
+
+    Used as a context manager around the chunk loop of a download.
+    """
+
+    def __init__(
+        self,
+        part_path: str,
+        append: bool,
+        start: int,
+        total: Optional[int],
+        name: str,
+        position: int,
+    ):
+        self._pbar = None
+        tqdm = _get_tqdm()
+        if tqdm is not None:
+            self._pbar = tqdm(total=total, initial=start, desc=name,
+                              position=position, unit="B", unit_scale=True,
+                              unit_divisor=1024)
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        flags |= os.O_APPEND if append else os.O_TRUNC
+        self._fd = os.open(part_path, flags, 0o644)
+        _fadvise(self._fd, "POSIX_FADV_SEQUENTIAL")
+        self._unadvised = 0
+
+    def write(self, chunk: bytes) -> None:
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(self._fd, view):]
+        self._unadvised += len(chunk)
+        if self._unadvised >= FADVISE_INTERVAL:
+            # Graph files are read once by the offsets build; don't
+            # let them evict everything else from the page cache
+            _fadvise(self._fd, "POSIX_FADV_DONTNEED")
+            self._unadvised = 0
+        if self._pbar is not None:
+            self._pbar.update(len(chunk))
+
+    def close(self) -> None:
+        os.close(self._fd)
+        if self._pbar is not None:
+            self._pbar.close()
+
+    def __enter__(self) -> "_PartWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _part_size(part_path: str) -> int:
+    return os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+
+def _fetch_part(
+    pool: "urllib3.PoolManager",
+    url: str,
+    part_path: str,
+    name: str,
+    position: int,
+) -> None:
+    """
+    Fetch url into part_path, resuming from its current size.
+
+    Raises urllib3's ProtocolError if the body ends before the size the
+    server announced: urllib3 < 2 doesn't enforce Content-Length, so a
+    connection closed early would otherwise look like a finished file.
+    """
+    import urllib3
+
+    start = _part_size(part_path)
+    headers = {"Range": f"bytes={start}-"} if start else {}
+
+    resp = pool.request(
+        "GET", url, headers=headers, preload_content=False,
+        timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=READ_TIMEOUT),
+    )
+    try:
+        plan = _plan_resume(resp.status, resp.headers, start, url)
+        if plan is None:
+            return
+        with _PartWriter(part_path, *plan, name, position) as out:
+            for chunk in resp.stream(CHUNK_SIZE):
+                out.write(chunk)
+    finally:
+        resp.release_conn()
+
+    total = plan[2]
+    if total is not None and _part_size(part_path) != total:
+        raise urllib3.exceptions.ProtocolError(
+            f"Connection closed after {_part_size(part_path)} of {total} bytes"
+        )
+
+
+async def _fetch_part_async(
+    session,
+    url: str,
+    part_path: str,
+    name: str,
+    position: int,
+) -> None:
+    """
+    aiohttp counterpart of _fetch_part().
+
+    Disk writes run on the default executor so a blocking 4 MiB write
+    never stalls the other transfers sharing the event loop.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    start = _part_size(part_path)
+    headers = {"Range": f"bytes={start}-"} if start else {}
 
-    print(f"  Downloading: {os.path.basename(dest_path)}")
+    async with session.get(url, headers=headers) as resp:
+        plan = _plan_resume(resp.status, resp.headers, start, url)
+        if plan is None:
+            return
+        with _PartWriter(part_path, *plan, name, position) as out:
+            async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                await loop.run_in_executor(None, out.write, chunk)
 
-    if HAS_TQDM:
-        def progress_hook(pbar):
-            def update(_, block_size, total_size):
-                if total_size > 0:
-                    pbar.total = total_size
-                    pbar.update(block_size)
-            return update
 
-        with tqdm(unit="B", unit_scale=True, unit_divisor=1024) as pbar:
-            urllib.request.urlretrieve(url, dest_path,
-                                       reporthook=progress_hook(pbar))
+def _announce(dest_path: str, existing_size: Optional[int]) -> Optional[str]:
+    """
+    Print the status of a download about to start.
+
+    Returns:
+        The .part path to download into, or None if dest_path already exists.
+    """
+    name = os.path.basename(dest_path)
+    if existing_size is None and os.path.exists(dest_path):
+        existing_size = os.path.getsize(dest_path)
+    if existing_size is not None:
+        print(f"  Already exists: {name} ({existing_size / (1024 * 1024):.1f} MB)")
+        return None
+
+    part_path = dest_path + ".part"
+    if os.path.exists(part_path):
+        size_mb = os.path.getsize(part_path) / (1024 * 1024)
+        print(f"  Resuming: {name} ({size_mb:.1f} MB already downloaded)")
     else:
-        urllib.request.urlretrieve(url, dest_path)
+        print(f"  Downloading: {name}")
+    return part_path
+
+
+def download_with_progress(
+    url: str,
+    dest_path: str,
+    pool: Optional["urllib3.PoolManager"] = None,
+    position: int = 0,
+    existing_size: Optional[int] = None,
+) -> None:
+    """
+    Download a file with progress bar if tqdm is available.
+
+    The response is streamed to a ``.part`` file in CHUNK_SIZE pieces and
+    renamed into place once complete, so large graph files are never held
+    in memory and an interrupted download is not mistaken for a finished one.
+    A leftover ``.part`` file is resumed with an HTTP Range request, and
+    dropped connections are retried with exponential backoff.
+
+    Args:
+        url: URL to download.
+        dest_path: Final path of the downloaded file.
+        pool: Connection pool to issue the request on. Defaults to the
+            shared process-wide pool.
+        position: tqdm bar position, for concurrent downloads.
+        existing_size: Size of dest_path if the caller already knows it
+            exists, which skips the filesystem check.
+    """
+    import urllib3
+
+    part_path = _announce(dest_path, existing_size)
+    if part_path is None:
+        return
+    name = os.path.basename(dest_path)
+
+    if pool is None:
+        pool = _get_pool()
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            _fetch_part(pool, url, part_path, name, position)
+            break
+        except urllib3.exceptions.HTTPError as e:
+            if attempt == MAX_RETRIES:
+                raise RuntimeError(
+                    f"Failed to download {url} after {MAX_RETRIES} retries: {e}"
+                ) from e
+            delay = RETRY_BACKOFF * 2 ** attempt
+            print(f"  Connection error on {name}, resuming in {delay:.0f}s: {e}")
+            time.sleep(delay)
+
+    os.replace(part_path, dest_path)
+    print(f"  Downloaded: {name}")
+
+
+def _jvm_heap_mb(num_jvms: int) -> Optional[int]:
+    """
+    Return a per-JVM -Xmx in MB that keeps num_jvms concurrent JVMs within
+    half of physical RAM, or None if RAM cannot be determined.
+    """
+    total = total_ram_bytes()
+    if total is None:
+        return None
+    return max(256, total // (1024 * 1024) // (2 * num_jvms))
+
+
+def _build_one(
+    graph_base: str,
+    jar_path: str,
+    heap_mb: Optional[int],
+) -> Tuple[str, int, str]:
+    """
+    Run BVGraph offset building for one graph.
+
+    Returns:
+        Tuple of (graph_name, returncode, stderr_tail), where stderr_tail
+        holds the last 64 lines of JVM output. A timeout is reported
+        as returncode -1 rather than raised, so concurrent builds can be
+        collected together.
+    """
+    graph_name = os.path.basename(graph_base)
+    cmd = ["java"]
+    if heap_mb is not None:
+        cmd.append(f"-Xmx{heap_mb}m")
+    cmd += [
+        "-cp", jar_path,
+        "it.unimi.dsi.webgraph.BVGraph",
+        "-O",
+        "-L",
+        graph_base,
+    ]
 
-    print(f"  Downloaded: {os.path.basename(dest_path)}")
+    # Stream stderr rather than capturing it: the JVM's progress logging
+    # is shown as it happens and only the tail is kept for error messages
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        bufsize=1,
+    )
+    timed_out = threading.Event()
+
+    def kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(OFFSETS_TIMEOUT, kill)
+    timer.start()
+    tail: Deque[str] = deque(maxlen=64)
+    try:
+        for line in proc.stderr:
+            line = line.rstrip()
+            if line:
+                tail.append(line)
+                print(f"    [{graph_name}] {line}")
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        # Don't leave a multi-GB JVM behind if reading was interrupted
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stderr.close()
+
+    if timed_out.is_set():
+        return graph_name, -1, f"Timeout building offsets after {OFFSETS_TIMEOUT}s"
+    return graph_name, returncode, "\n".join(tail)
 
 
 def build_offsets(
@@ -73,73 +430,69 @@ def build_offsets(
     """
     Build .offsets files required by WebGraph for random access.
 
+    The forward and transpose graphs are independent, so their offsets
+    are built by concurrent JVMs, each capped so that together they use
+    at most half of physical RAM.
+
     Args:
         webgraph_dir: Directory containing the graph files.
         version: Webgraph version string.
         jar_path: Path to cc-webgraph JAR. If None, auto-detects.
-    """
-    if jar_path is None:
-        jar_path = find_jar()
 
+    Raises:
+        RuntimeError: If any offsets build fails, listing every failure.
+    """
     graphs = [
         f"{version}-domain",
         f"{version}-domain-t",
     ]
 
-    for graph_name in graphs:
-        graph_base = os.path.join(webgraph_dir, graph_name)
-        offsets_file = f"{graph_base}.offsets"
+    # Join the directory once; per-graph paths are plain concatenation
+    base = os.path.join(os.fspath(webgraph_dir), "")
 
-        if os.path.exists(offsets_file):
+    pending = []
+    for graph_name in graphs:
+        graph_base = base + graph_name
+        if os.path.exists(graph_base + ".offsets"):
             print(f"  Offsets already exist: {graph_name}.offsets")
-            continue
+        else:
+            print(f"  Building offsets for {graph_name}...")
+            pending.append(graph_base)
 
-        print(f"  Building offsets for {graph_name}...")
+    # Only look for the JAR once there is something to build
+    if not pending:
+        return
+    if jar_path is None:
+        jar_path = find_jar()
 
-        cmd = [
-            "java",
-            "-cp", jar_path,
-            "it.unimi.dsi.webgraph.BVGraph",
-            "-O",
-            "-L",
-            graph_base,
+    heap_mb = _jvm_heap_mb(len(pending))
+    failures = []
+    with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+        futures = [
+            executor.submit(_build_one, graph_base, jar_path, heap_mb)
+            for graph_base in pending
         ]
-
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-
-            if result.returncode != 0:
-                stderr = result.stderr.strip()
-                raise RuntimeError(
-                    f"Failed to build offsets for {graph_name}: {stderr}"
-                )
-
-            if os.path.exists(offsets_file):
+        for future in as_completed(futures):
+            graph_name, returncode, stderr = future.result()
+            if returncode != 0:
+                failures.append(f"{graph_name}: {stderr}")
+            elif os.path.exists(base + graph_name + ".offsets"):
                 print(f"  Built {graph_name}.offsets")
             else:
                 print(f"  Warning: command succeeded but {graph_name}.offsets not found")
 
-        except subprocess.TimeoutExpired:
-            raise RuntimeError(f"Timeout building offsets for {graph_name}")
+    if failures:
+        raise RuntimeError(
+            "Failed to build offsets:\n  " + "\n  ".join(sorted(failures))
+        )
 
 
-def download_webgraph(
-    webgraph_dir: str,
-    version: str,
-    jar_path: Optional[str] = None,
-) -> None:
+def _pending_downloads(webgraph_dir: str, version: str) -> List[Tuple[str, str]]:
     """
-    Download CommonCrawl webgraph files and build offsets.
+    Print the download header and report files already present.
 
-    Args:
-        webgraph_dir: Directory to download files to.
-        version: Webgraph version string.
-        jar_path: Path to cc-webgraph JAR for building offsets.
+    Returns:
+        List of (url, dest_path) for the files still to be downloaded.
     """
     base_url = (
         f"https://data.commoncrawl.org/projects/hyperlinkgraph/{version}/domain"
@@ -152,10 +505,51 @@ def download_webgraph(
     print(f"Destination: {webgraph_dir}")
     print("=" * 60)
 
+    # One directory read answers "already downloaded?" for every file
+    with os.scandir(webgraph_dir) as it:
+        existing = {e.name: e.stat().st_size for e in it if e.is_file()}
+
+    url_base = base_url + "/"
+    dest_base = os.path.join(os.fspath(webgraph_dir), "")
+
+    pending = []
     for filename in files:
-        url = f"{base_url}/{filename}"
-        dest = os.path.join(webgraph_dir, filename)
-        download_with_progress(url, dest)
+        url = url_base + filename
+        dest = dest_base + filename
+        if filename in existing:
+            _announce(dest, existing[filename])
+        else:
+            pending.append((url, dest))
+    return pending
+
+
+def download_webgraph(
+    webgraph_dir: str,
+    version: str,
+    jar_path: Optional[str] = None,
+) -> None:
+    """
+    Download CommonCrawl webgraph files and build offsets.
+
+    Args:
+        webgraph_dir: Directory to download files to.
+        version: Webgraph version string.
+        jar_path: Path to cc-webgraph JAR for building offsets.
+    """
+    pending = _pending_downloads(webgraph_dir, version)
+
+    if pending:
+        # Files are independent and transfer time is network-bound, so fetch
+        # them concurrently over the keep-alive pool sized to the worker count
+        workers = min(MAX_DOWNLOAD_WORKERS, len(pending))
+        pool = _get_pool(workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(download_with_progress, url, dest, pool, position)
+                for position, (url, dest) in enumerate(pending)
+            ]
+            for future in as_completed(futures):
+                future.result()
 
     print("=" * 60)
     print("All graph files downloaded!")
@@ -164,3 +558,94 @@ def download_webgraph(
     build_offsets(webgraph_dir, version, jar_path)
 
     print("\nWebgraph ready for use!")
+
+
+async def _download_async(
+    session,
+    semaphore,
+    url: str,
+    dest_path: str,
+    position: int,
+) -> None:
+    """Download one file on an aiohttp session, resuming and retrying."""
+    import asyncio
+
+    import aiohttp
+
+    part_path = _announce(dest_path, None)
+    if part_path is None:
+        return
+    name = os.path.basename(dest_path)
+
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                await _fetch_part_async(session, url, part_path, name, position)
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == MAX_RETRIES:
+                    raise RuntimeError(
+                        f"Failed to download {url} after {MAX_RETRIES} retries: {e}"
+                    ) from e
+                delay = RETRY_BACKOFF * 2 ** attempt
+                print(f"  Connection error on {name}, resuming in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+
+    os.replace(part_path, dest_path)
+    print(f"  Downloaded: {name}")
+
+
+async def download_webgraph_async(
+    webgraph_dir: str,
+    version: str,
+    jar_path: Optional[str] = None,
+    max_concurrency: int = 8,
+) -> None:
+    """
+    Coroutine version of download_webgraph() built on aiohttp.
+
+    Useful when scripting downloads of several versions from one event
+    loop: all files share a single keep-alive connector, with at most
+    max_concurrency transfers in flight.
+
+    Requires: pip install pyccwebgraph[async]
+
+    Args:
+        webgraph_dir: Directory to download files to.
+        version: Webgraph version string.
+        jar_path: Path to cc-webgraph JAR for building offsets.
+        max_concurrency: Maximum number of simultaneous downloads.
+    """
+    import asyncio
+
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            "aiohttp is required for download_webgraph_async(). "
+            "Install with: pip install pyccwebgraph[async]"
+        )
+
+    pending = _pending_downloads(webgraph_dir, version)
+
+    if pending:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=max_concurrency,
+                                         keepalive_timeout=60)
+        # Graph files take far longer than aiohttp's default 5 minute total
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+        async with aiohttp.ClientSession(connector=connector,
+                                         timeout=timeout) as session:
+            await asyncio.gather(*[
+                _download_async(session, semaphore, url, dest, position)
+                for position, (url, dest) in enumerate(pending)
+            ])
+
+    print("=" * 60)
+    print("All graph files downloaded!")
+
+    print("\nBuilding offset files (required for graph queries)...")
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, build_offsets, webgraph_dir, version, jar_path)
+
+    print("\nWebgraph ready for use!")
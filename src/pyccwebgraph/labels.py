@@ -0,0 +1,158 @@
+"""
+Memory-mapped vertex label index for pyccwebgraph.
+
+Resolving vertex IDs to labels through py4j costs a socket round trip per
+call. The label table is static, so it is unpacked once from the gzipped
+vertices file into a plain label file plus an int64 offsets file, which
+are then memory-mapped and read directly from Python.
+
+Labels are stored in CommonCrawl reversed notation (e.g. "com.cnn").
+"""
+
+import gzip
+import mmap
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+def get_label_index_files(webgraph_dir: str, version: str) -> Tuple[str, str]:
+    """Return (labels_path, offsets_path) of the label index for a version."""
+    base = os.path.join(webgraph_dir, f"{version}-domain-labels")
+    return f"{base}.txt", f"{base}.idx"
+
+
+def build_label_index(
+    webgraph_dir: str,
+    version: str,
+    chunk_size: int = 1 << 20,
+) -> None:
+    """
+    Build the label index from the gzipped vertices file.
+
+    Writes one label per line (line number == vertex ID) and a file of
+    little-endian int64 line start offsets with one trailing entry for the
+    end of the file. Both are written to temporary names and renamed at
+    the end, so an interrupted build is never mistaken for a complete one.
+
+    LabelIndex.lookup() binary-searches the labels, so the build checks
+    that vertex IDs are consecutive and labels strictly increasing in
+    byte order, and refuses to write an index that breaks either.
+
+    Args:
+        webgraph_dir: Directory containing the graph files.
+        version: Webgraph version string.
+        chunk_size: Number of offsets buffered before each write.
+
+    Raises:
+        ValueError: If the vertices file is not sorted as required.
+    """
+    vertices = os.path.join(webgraph_dir, f"{version}-domain-vertices.txt.gz")
+    labels_path, offsets_path = get_label_index_files(webgraph_dir, version)
+    labels_tmp = labels_path + ".tmp"
+    offsets_tmp = offsets_path + ".tmp"
+
+    try:
+        with gzip.open(vertices, "rb") as src, \
+                open(labels_tmp, "wb") as labels_out, \
+                open(offsets_tmp, "wb") as offsets_out:
+            pos = 0
+            offsets = [0]
+            prev = None
+            for vid, line in enumerate(src):
+                # Vertex lines are "<id>\t<reversed domain>[\t<num hosts>]"
+                fields = line.rstrip(b"\r\n").split(b"\t", 2)
+                label = fields[1]
+                if int(fields[0]) != vid or (prev is not None and label <= prev):
+                    raise ValueError(
+                        f"{vertices} is not sorted by vertex ID and label at "
+                        f"line {vid + 1}; label index lookups would be wrong"
+                    )
+                prev = label
+                labels_out.write(label + b"\n")
+                pos += len(label) + 1
+                offsets.append(pos)
+                if len(offsets) >= chunk_size:
+                    offsets_out.write(np.asarray(offsets, dtype="<i8").tobytes())
+                    offsets = []
+            offsets_out.write(np.asarray(offsets, dtype="<i8").tobytes())
+    except BaseException:
+        for path in (labels_tmp, offsets_tmp):
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+
+    os.replace(labels_tmp, labels_path)
+    os.replace(offsets_tmp, offsets_path)
+
+
+class LabelIndex:
+    """
+    Read-only, memory-mapped vertex ID <-> label table.
+
+    ID -> label is a direct slice of the mapped label file. Label -> ID is
+    a binary search, relying on vertex IDs being assigned in lexicographic
+    order of their labels, as in the CommonCrawl webgraph releases.
+    """
+
+    def __init__(self, labels_path: str, offsets_path: str):
+        self._offsets = np.memmap(offsets_path, dtype="<i8", mode="r")
+        self._file = open(labels_path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def open(cls, webgraph_dir: str, version: str) -> Optional["LabelIndex"]:
+        """Open the label index for a version, or return None if not built."""
+        labels_path, offsets_path = get_label_index_files(webgraph_dir, version)
+        if not (os.path.exists(labels_path) and os.path.exists(offsets_path)):
+            return None
+        return cls(labels_path, offsets_path)
+
+    def close(self) -> None:
+        """Release the memory maps."""
+        self._mm.close()
+        self._file.close()
+        self._offsets = None
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _raw(self, vid: int) -> bytes:
+        # Offsets point at line starts; drop the trailing newline
+        return self._mm[int(self._offsets[vid]):int(self._offsets[vid + 1]) - 1]
+
+    def label(self, vid: int) -> Optional[str]:
+        """Return the label for a vertex ID, or None if out of range."""
+        if not 0 <= vid < len(self):
+            return None
+        return self._raw(vid).decode("utf-8")
+
+    def labels(self, vids: List[int]) -> List[Optional[str]]:
+        """Return labels for many vertex IDs (None for out-of-range IDs)."""
+        n = len(self)
+        ids = np.asarray(vids, dtype=np.int64)
+        valid = (ids >= 0) & (ids < n)
+        starts = np.zeros(len(ids), dtype=np.int64)
+        ends = np.zeros(len(ids), dtype=np.int64)
+        starts[valid] = self._offsets[ids[valid]]
+        ends[valid] = self._offsets[ids[valid] + 1] - 1
+        mm = self._mm
+        return [
+            mm[start:end].decode("utf-8") if ok else None
+            for start, end, ok in zip(starts.tolist(), ends.tolist(), valid.tolist())
+        ]
+
+    def lookup(self, label: str) -> int:
+        """Return the vertex ID for a label, or -1 if not present."""
+        key = label.encode("utf-8")
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._raw(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self._raw(lo) == key:
+            return lo
+        return -1
@@ -5,37 +5,89 @@ Handles Java version checking, JAR detection, path resolution,
 and environment validation.
 """
 
+import functools
+import glob
 import os
 import re
 import shutil
 import subprocess
+import sys
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Set, Tuple
+
+from .labels import get_label_index_files
 
 
 DEFAULT_DATA_DIR = os.path.join(str(Path.home()), ".pyccwebgraph", "data")
 DEFAULT_VERSION = "cc-main-2024-feb-apr-may"
 
+_PKG_DIR = os.path.dirname(os.path.abspath(__file__))
+_JAR_NAME = "cc-webgraph-0.1-SNAPSHOT-jar-with-dependencies.jar"
+_BUNDLED_JAR = os.path.join(_PKG_DIR, "jars", _JAR_NAME)
+# GraphUtil batch helpers, built from java/ by java/build_helpers.sh
+_HELPER_JAR = os.path.join(_PKG_DIR, "jars", "pyccwebgraph-helpers.jar")
+
+# Quoted version string, as in `java -version` output and the JDK release file
+_JAVA_VER_RE = re.compile(r'"(\d+)[\.\d]*"')
+
+# Per-version file names are "<version><suffix>"
+_REQUIRED_SUFFIXES = (
+    "-domain-vertices.txt.gz",
+    "-domain.graph",
+    "-domain.properties",
+    "-domain-t.graph",
+    "-domain-t.properties",
+    "-domain.stats",
+)
+_OFFSETS_SUFFIXES = (
+    "-domain.offsets",
+    "-domain-t.offsets",
+)
+
 
 def check_java(min_version: int = 17) -> Tuple[bool, str]:
     """
     Check if Java is installed and meets the minimum version requirement.
 
+    The installed version is detected once and cached for the life of
+    the process, whatever min_version is asked for; call
+    _clear_setup_caches() after changing the Java installation.
+
     Args:
         min_version: Minimum Java version required (default: 17)
 
     Returns:
         Tuple of (meets_requirement, version_string_or_error_message)
     """
+    major, error = _detect_java_version()
+    if major is None:
+        return False, error
+    if major >= min_version:
+        return True, f"Java {major}"
+    return False, (
+        f"Java {major} found, but Java {min_version}+ is required.\n"
+        f"Please upgrade your Java installation."
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_java_version() -> Tuple[Optional[int], str]:
+    """
+    Return (major_version, "") for the java on PATH, or (None, error_message).
+    """
     java_bin = shutil.which("java")
     if java_bin is None:
-        return False, (
+        return None, (
             "Java not found. Please install Java 17+:\n"
             "  Ubuntu/Debian: sudo apt install openjdk-17-jdk\n"
             "  macOS:         brew install openjdk@17\n"
             "  Windows:       https://adoptium.net/"
         )
 
+    major = _release_file_version(java_bin)
+    if major is not None:
+        return major, ""
+
     try:
         result = subprocess.run(
             ["java", "-version"],
@@ -43,32 +95,58 @@ def check_java(min_version: int = 17) -> Tuple[bool, str]:
             text=True,
             timeout=10,
         )
-        # Java version is printed to stderr
-        output = result.stderr + result.stdout
-        match = re.search(r'"(\d+)[\.\d]*"', output)
-        if match:
-            major = int(match.group(1))
-            if major >= min_version:
-                return True, f"Java {major}"
-            else:
-                return False, (
-                    f"Java {major} found, but Java {min_version}+ is required.\n"
-                    f"Please upgrade your Java installation."
-                )
-        return False, f"Could not parse Java version from: {output.strip()}"
     except (subprocess.TimeoutExpired, OSError) as e:
-        return False, f"Error checking Java version: {e}"
+        return None, f"Error checking Java version: {e}"
+    # Java version is printed to stderr
+    output = result.stderr + result.stdout
+    match = _JAVA_VER_RE.search(output)
+    if not match:
+        return None, f"Could not parse Java version from: {output.strip()}"
+    return int(match.group(1)), ""
+
+
+def _release_file_version(java_bin: str) -> Optional[int]:
+    """
+    Read the major Java version from the JDK's ``release`` file.
+
+    Avoids starting a JVM just to print its version. JAVA_HOME is used
+    when it points at the same java binary found on PATH; otherwise the
+    home is derived from the resolved binary (``<home>/bin/java``).
+    Returns None if no readable release file is found.
+    """
+    java_bin = os.path.realpath(java_bin)
+    home = os.path.dirname(os.path.dirname(java_bin))
+    java_home = os.environ.get("JAVA_HOME")
+    if java_home:
+        home_bin = os.path.join(java_home, "bin", os.path.basename(java_bin))
+        if os.path.exists(home_bin) and os.path.samefile(home_bin, java_bin):
+            home = java_home
+
+    try:
+        with open(os.path.join(home, "release"), encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("JAVA_VERSION="):
+                    match = _JAVA_VER_RE.search(line)
+                    return int(match.group(1)) if match else None
+    except OSError:
+        pass
+    return None
 
 
+@functools.lru_cache(maxsize=8)
 def find_jar(jar_path: Optional[str] = None) -> str:
     """
     Locate the cc-webgraph JAR file.
 
+    Successful lookups are cached per jar_path for the life of the
+    process; call _clear_setup_caches() after moving JARs around.
+
     Search order:
     1. Explicit jar_path argument
     2. CC_WEBGRAPH_JAR environment variable
     3. Bundled JAR in package jars/ directory
     4. Common build locations (cc-webgraph/target/)
+    5. Any other cc-webgraph*.jar in package jars/ directory
 
     Args:
         jar_path: Explicit path to JAR file, or None for auto-detection.
@@ -85,36 +163,8 @@ def find_jar(jar_path: Optional[str] = None) -> str:
             return jar_path
         raise FileNotFoundError(f"JAR not found at specified path: {jar_path}")
 
-    # 2. Environment variable
-    env_jar = os.environ.get("CC_WEBGRAPH_JAR")
-    if env_jar and os.path.exists(env_jar):
-        return env_jar
-
-    # 3. Bundled JAR in package
-    pkg_dir = os.path.dirname(os.path.abspath(__file__))
-    bundled = os.path.join(pkg_dir, "jars",
-                           "cc-webgraph-0.1-SNAPSHOT-jar-with-dependencies.jar")
-    if os.path.exists(bundled):
-        return bundled
-
-    # 4. Common build locations
-    jar_name = "cc-webgraph-0.1-SNAPSHOT-jar-with-dependencies.jar"
-    search_dirs = [
-        # Docker / deployed
-        "/app/cc-webgraph.jar",
-        # Colab
-        "/content/cc-webgraph/target",
-        # Relative to CWD
-        os.path.join(os.getcwd(), "cc-webgraph", "target"),
-        # Parent of CWD
-        os.path.join(os.path.dirname(os.getcwd()), "cc-webgraph", "target"),
-    ]
-
-    for path in search_dirs:
-        if os.path.isfile(path):
-            return path
-        candidate = os.path.join(path, jar_name)
-        if os.path.exists(candidate):
+    for candidate in _jar_candidates():
+        if candidate and Path(candidate).is_file():
             return candidate
 
     raise FileNotFoundError(
@@ -127,6 +177,60 @@ def find_jar(jar_path: Optional[str] = None) -> str:
     )
 
 
+def _jar_candidates() -> Iterator[Optional[str]]:
+    """
+    Yield JAR locations for find_jar() in search order.
+
+    A generator, so the CWD-relative locations (and the getcwd() call
+    behind them) are only computed when every earlier candidate misses.
+    """
+    # 2. Environment variable
+    yield os.environ.get("CC_WEBGRAPH_JAR")
+    # 3. Bundled JAR in package
+    yield _BUNDLED_JAR
+    # 4. Common build locations: Docker / deployed, Colab, relative to
+    # CWD and its parent
+    yield "/app/cc-webgraph.jar"
+    yield os.path.join("/content/cc-webgraph/target", _JAR_NAME)
+    cwd = os.getcwd()
+    yield os.path.join(cwd, "cc-webgraph", "target", _JAR_NAME)
+    yield os.path.join(os.path.dirname(cwd), "cc-webgraph", "target", _JAR_NAME)
+    # 5. Any other cc-webgraph build dropped into the package jars/
+    yield from sorted(glob.glob(os.path.join(_PKG_DIR, "jars", "cc-webgraph*.jar")))
+
+
+def find_helper_jar() -> Optional[str]:
+    """
+    Locate the pyccwebgraph helpers JAR (GraphUtil batch methods).
+
+    Checks the PYCCWEBGRAPH_HELPER_JAR environment variable, then the
+    package jars/ directory. The helpers are optional: without them the
+    graph is queried with one py4j call per vertex.
+
+    Returns:
+        Path to the JAR file, or None if it is not available.
+    """
+    for candidate in (os.environ.get("PYCCWEBGRAPH_HELPER_JAR"), _HELPER_JAR):
+        if candidate and Path(candidate).is_file():
+            return candidate
+    return None
+
+
+def _clear_setup_caches() -> None:
+    """Forget cached check_java() and find_jar() results."""
+    _detect_java_version.cache_clear()
+    find_jar.cache_clear()
+
+
+def _dir_entries(path: str) -> Set[str]:
+    """Return the names in a directory from one scandir, or empty if missing."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def check_webgraph_data(webgraph_dir: str, version: str) -> Tuple[bool, list]:
     """
     Check if required webgraph data files exist.
@@ -138,45 +242,68 @@ def check_webgraph_data(webgraph_dir: str, version: str) -> Tuple[bool, list]:
     Returns:
         Tuple of (all_present, list_of_missing_files)
     """
-    required = get_required_files(version)
-    missing = []
-    for f in required:
-        if not os.path.exists(os.path.join(webgraph_dir, f)):
-            missing.append(f)
+    entries = _dir_entries(webgraph_dir)
+    missing = [f for f in get_required_files(version) if f not in entries]
     return len(missing) == 0, missing
 
 
-def get_required_files(version: str) -> list:
-    """Return list of files required for a given webgraph version."""
-    return [
-        f"{version}-domain-vertices.txt.gz",
-        f"{version}-domain.graph",
-        f"{version}-domain.properties",
-        f"{version}-domain-t.graph",
-        f"{version}-domain-t.properties",
-        f"{version}-domain.stats",
-    ]
+@functools.lru_cache(maxsize=8)
+def get_required_files(version: str) -> Tuple[str, ...]:
+    """Return the files required for a given webgraph version."""
+    return tuple(version + suffix for suffix in _REQUIRED_SUFFIXES)
+
+
+@functools.lru_cache(maxsize=8)
+def get_offsets_files(version: str) -> Tuple[str, ...]:
+    """Return the offsets files built for a given webgraph version."""
+    return tuple(version + suffix for suffix in _OFFSETS_SUFFIXES)
 
 
 def check_offsets(webgraph_dir: str, version: str) -> Tuple[bool, list]:
     """Check if offset files have been built."""
-    offsets = [
-        f"{version}-domain.offsets",
-        f"{version}-domain-t.offsets",
+    entries = _dir_entries(webgraph_dir)
+    missing = [f for f in get_offsets_files(version) if f not in entries]
+    return len(missing) == 0, missing
+
+
+def check_label_index(webgraph_dir: str, version: str) -> Tuple[bool, list]:
+    """Check if the memory-mapped label index has been built."""
+    entries = _dir_entries(webgraph_dir)
+    missing = [
+        name
+        for name in map(os.path.basename, get_label_index_files(webgraph_dir, version))
+        if name not in entries
     ]
-    missing = []
-    for f in offsets:
-        if not os.path.exists(os.path.join(webgraph_dir, f)):
-            missing.append(f)
     return len(missing) == 0, missing
 
 
-def check_ram(min_gb: int = 20) -> bool:
-    """Check if sufficient RAM is available."""
+def total_ram_bytes() -> Optional[int]:
+    """
+    Return physical RAM in bytes, or None if it cannot be determined.
+
+    Reads /proc/meminfo on Linux and only falls back to psutil elsewhere,
+    avoiding the psutil import on the common path.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    # "MemTotal:       65843392 kB"
+                    if line.startswith("MemTotal:"):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
     try:
         import psutil
-        ram_gb = psutil.virtual_memory().total / (1024 ** 3)
-        return ram_gb >= min_gb
     except ImportError:
-        # Can't check without psutil, assume OK
+        return None
+    return psutil.virtual_memory().total
+
+
+def check_ram(min_gb: int = 20) -> bool:
+    """Check if sufficient RAM is available."""
+    total = total_ram_bytes()
+    if total is None:
+        # Can't determine RAM, assume OK
         return True
+    return total / (1024 ** 3) >= min_gb
@@ -4,9 +4,20 @@ Note: Full integration tests require a running JVM with webgraph data.
 These tests cover initialization logic and error handling.
 """
 
+import gzip
+import os
+import pickle
+
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
-from pyccwebgraph.ccwebgraph import CCWebgraph
+from py4j.protocol import Py4JError
+from pyccwebgraph.ccwebgraph import (
+    CCWebgraph,
+    _aggregate,
+    _count_neighbors,
+)
+from pyccwebgraph.labels import build_label_index
 
 
 class TestCCWebgraphInit:
@@ -15,6 +26,11 @@ class TestCCWebgraphInit:
             with pytest.raises(ImportError, match="py4j"):
                 CCWebgraph("/tmp/data", jar_path="/fake/jar")
 
+    def test_old_py4j_raises(self):
+        with patch("pyccwebgraph.ccwebgraph._PY4J_VERSION", "0.10.0"):
+            with pytest.raises(ImportError, match="0.10.9.7"):
+                CCWebgraph("/tmp/data", jar_path="/fake/jar")
+
     def test_init_sets_attributes(self, tmp_path):
         jar = tmp_path / "test.jar"
         jar.touch()
@@ -33,6 +49,66 @@ class TestCCWebgraphInit:
             wg._ensure_loaded()
 
 
+class TestLoadGraph:
+    def load(self, tmp_path, helper_jar):
+        jar = tmp_path / "test.jar"
+        jar.touch()
+        with patch("pyccwebgraph.ccwebgraph.find_jar", return_value=str(jar)):
+            wg = CCWebgraph(str(tmp_path))
+        with patch("pyccwebgraph.ccwebgraph.launch_gateway",
+                   return_value=1234) as launch, \
+                patch("pyccwebgraph.ccwebgraph.JavaGateway"), \
+                patch("pyccwebgraph.ccwebgraph.find_helper_jar",
+                      return_value=helper_jar), \
+                patch("pyccwebgraph.ccwebgraph.atexit"):
+            wg.load_graph()
+        return str(jar), launch.call_args.kwargs["classpath"]
+
+    def test_helper_jar_on_classpath(self, tmp_path):
+        jar, classpath = self.load(tmp_path, "/opt/helpers.jar")
+        assert classpath == os.pathsep.join([jar, "/opt/helpers.jar"])
+
+    def test_without_helper_jar(self, tmp_path):
+        jar, classpath = self.load(tmp_path, None)
+        assert classpath == jar
+
+
+class TestOpenLabelIndex:
+    @pytest.fixture
+    def wg(self, loaded_wg, tmp_path):
+        labels = ["com.bbc", "com.cnn"]
+        with gzip.open(tmp_path / f"{loaded_wg.version}-domain-vertices.txt.gz",
+                       "wt") as f:
+            for i, label in enumerate(labels):
+                f.write(f"{i}\t{label}\t1\n")
+        build_label_index(str(tmp_path), loaded_wg.version)
+        loaded_wg.graph.vertexIdToLabel.side_effect = lambda vid: labels[vid]
+        return loaded_wg
+
+    def test_matching_index_used(self, wg):
+        with patch("pyccwebgraph.ccwebgraph.get_field") as get_field:
+            get_field.return_value.numNodes.return_value = 2
+            labels = wg._open_label_index()
+        assert labels is not None
+        labels.close()
+
+    def test_wrong_size_ignored(self, wg):
+        with patch("pyccwebgraph.ccwebgraph.get_field") as get_field:
+            get_field.return_value.numNodes.return_value = 3
+            assert wg._open_label_index() is None
+
+    def test_wrong_labels_ignored(self, wg):
+        wg.graph.vertexIdToLabel.side_effect = lambda vid: "org.other"
+        with patch("pyccwebgraph.ccwebgraph.get_field") as get_field:
+            get_field.return_value.numNodes.return_value = 2
+            assert wg._open_label_index() is None
+
+    def test_unreadable_size_ignored(self, wg):
+        with patch("pyccwebgraph.ccwebgraph.get_field",
+                   side_effect=Py4JError("no field")):
+            assert wg._open_label_index() is None
+
+
 class TestSetupClassmethod:
     def test_no_java_raises(self):
         with patch(
@@ -54,3 +130,293 @@ class TestSetupClassmethod:
                 CCWebgraph.setup(
                     webgraph_dir=str(tmp_path), auto_download=False
                 )
+
+
+@pytest.fixture
+def loaded_wg(tmp_path):
+    """CCWebgraph with a mocked gateway and graph (no JVM)."""
+    jar = tmp_path / "test.jar"
+    jar.touch()
+    with patch("pyccwebgraph.ccwebgraph.find_jar", return_value=str(jar)):
+        wg = CCWebgraph(str(tmp_path))
+    wg.gateway = MagicMock()
+    wg.graph = MagicMock()
+    wg._bind_jvm_helpers()
+    return wg
+
+
+class TestNeighborsBatch:
+    def test_splits_length_prefixed_array(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        flat = np.array([2, 5, 6, 0, 1, 7], dtype="<i4")
+        loaded_wg._util.intsToBytes.return_value = flat.tobytes()
+        arrays = loaded_wg._neighbors_batch([10, 11, 12], backlinks=True)
+        assert [a.tolist() for a in arrays] == [[5, 6], [], [7]]
+        assert loaded_wg._util.neighborsBatch.call_count == 1
+
+    def test_fallback_without_helper(self, loaded_wg):
+        loaded_wg._j_arrays_to_string.side_effect = ["[1, 2]", "[]"]
+        arrays = loaded_wg._neighbors_batch([10, 11], backlinks=False)
+        assert [a.tolist() for a in arrays] == [[1, 2], []]
+        assert loaded_wg.graph.successors.call_count == 2
+
+
+class TestArrayTransfer:
+    def test_long_array_to_java_as_bytes(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        loaded_wg._to_java_long_array([3, 1 << 40])
+        buf = loaded_wg._util.bytesToLongArray.call_args[0][0]
+        assert np.frombuffer(buf, dtype="<i8").tolist() == [3, 1 << 40]
+        loaded_wg._new_array.assert_not_called()
+
+    def test_int_array_from_bytes(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        values = np.array([0, 1, 93_000_000], dtype="<i4")
+        loaded_wg._util.intsToBytes.return_value = bytearray(values.tobytes())
+        result = loaded_wg._java_int_array_to_numpy(MagicMock())
+        assert result.tolist() == [0, 1, 93_000_000]
+
+    def test_long_array_text_fallback(self, loaded_wg):
+        loaded_wg._j_arrays_to_string.return_value = "[]"
+        result = loaded_wg._java_long_array_to_numpy(MagicMock())
+        assert result.dtype == np.int64
+        assert len(result) == 0
+
+
+class TestCountNeighbors:
+    ARRAYS = [
+        np.array([5, 6, 1], dtype=np.int32),
+        np.array([6, 7], dtype=np.int32),
+        np.array([6, 0], dtype=np.int32),
+    ]
+
+    def test_counts_and_edges(self):
+        ids, counts, edge_seed_idx, num_unique = _count_neighbors(
+            self.ARRAYS, np.array([0, 1, 2])
+        )
+        assert ids.tolist() == [5, 6, 7]
+        assert counts.tolist() == [1, 3, 1]
+        assert edge_seed_idx.tolist() == [0, 0, 1, 2, 1]
+        assert num_unique == 3
+
+    def test_threshold(self):
+        ids, counts, edge_seed_idx, num_unique = _count_neighbors(
+            self.ARRAYS, np.array([0, 1, 2]), min_connections=2
+        )
+        assert ids.tolist() == [6]
+        assert counts.tolist() == [3]
+        assert edge_seed_idx.tolist() == [0, 1, 2]
+        assert num_unique == 3
+
+    @pytest.mark.parametrize("min_connections", [1, 2, 3, 4])
+    def test_matches_reference(self, min_connections):
+        rng = np.random.default_rng(0)
+        ids = rng.integers(0, 50, size=500).astype(np.int64)
+        seed_idx = rng.integers(0, 10, size=500).astype(np.int64)
+        neighbor_ids, counts, edge_seed_idx, num_unique = _aggregate(
+            ids, seed_idx, min_connections
+        )
+        groups = {}
+        for vid, sidx in zip(ids.tolist(), seed_idx.tolist()):
+            groups.setdefault(vid, []).append(sidx)
+        kept = sorted(v for v, g in groups.items() if len(g) >= min_connections)
+        assert neighbor_ids.tolist() == kept
+        assert counts.tolist() == [len(groups[v]) for v in kept]
+        assert edge_seed_idx.tolist() == [s for v in kept for s in groups[v]]
+        assert num_unique == len(groups)
+
+
+class TestAggregateNeighbors:
+    def test_decodes_java_discover_blob(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        blob = np.array(
+            [3, 2, 5, 3, 4, 3, 2, 0, 1, 2, 0, 1], dtype="<i8"
+        ).tobytes()
+        loaded_wg._util.discover.return_value = blob
+        ids, counts, edge_seed_idx, num_unique = loaded_wg._aggregate_neighbors(
+            [0, 1, 2], min_connections=2, backlinks=True
+        )
+        assert num_unique == 3
+        assert ids.tolist() == [3, 4]
+        assert counts.tolist() == [3, 2]
+        assert edge_seed_idx.tolist() == [0, 1, 2, 0, 1]
+        assert loaded_wg._util.discover.call_count == 1
+
+
+class TestDiscover:
+    """discover() against a fake three-seed graph (vertex ID == index)."""
+
+    LABELS = ["cnn.com", "bbc.com", "nyt.com", "agg.com", "blog.org"]
+    BACKLINKS = {0: [3, 4, 1], 1: [3, 4], 2: [3]}
+
+    @pytest.fixture
+    def fake_graph(self, loaded_wg):
+        labels = self.LABELS
+
+        def fetch_ids(domains):
+            return np.array(
+                [labels.index(d) if d in labels else -1 for d in domains]
+            )
+
+        def neighbors(seed_ids, backlinks):
+            return [np.array(self.BACKLINKS[s], dtype=np.int32)
+                    for s in seed_ids]
+
+        loaded_wg._fetch_ids = fetch_ids
+        loaded_wg._lookup_labels = lambda vids: [labels[v] for v in vids]
+        loaded_wg._neighbors_batch = neighbors
+        return loaded_wg
+
+    def test_nodes_sorted_and_filtered(self, fake_graph):
+        result = fake_graph.discover(
+            ["cnn.com", "bbc.com", "nyt.com", "missing.com"],
+            min_connections=2,
+        )
+        assert result.seeds == ["cnn.com", "bbc.com", "nyt.com"]
+        assert [n["domain"] for n in result.nodes] == ["agg.com", "blog.org"]
+        assert result.nodes[0]["connections"] == 3
+        assert result.nodes[1]["percentage"] == 66.67
+
+    def test_edges_excluding_seeds(self, fake_graph):
+        result = fake_graph.discover(["cnn.com", "bbc.com", "nyt.com"])
+        assert "5 edges" in repr(result)
+        assert result._edges is None
+        assert sorted(result.edges) == [
+            ("agg.com", "bbc.com"),
+            ("agg.com", "cnn.com"),
+            ("agg.com", "nyt.com"),
+            ("blog.org", "bbc.com"),
+            ("blog.org", "cnn.com"),
+        ]
+
+    def test_pickles_before_edges_built(self, fake_graph):
+        result = fake_graph.discover(["cnn.com", "bbc.com", "nyt.com"])
+        clone = pickle.loads(pickle.dumps(result))
+        assert clone._edges is None
+        assert sorted(clone.edges) == sorted(result.edges)
+
+    @pytest.mark.parametrize("method, backlinks", [
+        ("shared_outlinks", False),
+        ("shared_backlinks", True),
+    ])
+    def test_shared_results_pickle(self, loaded_wg, method, backlinks):
+        loaded_wg.shared_successors = lambda seeds, min_shared: ["agg.com", "cnn.com"]
+        loaded_wg.shared_predecessors = loaded_wg.shared_successors
+        result = getattr(loaded_wg, method)(["cnn.com", "bbc.com"])
+        clone = pickle.loads(pickle.dumps(result))
+        expected = [("agg.com", s) for s in result.seeds]
+        if not backlinks:
+            expected = [(s, d) for d, s in expected]
+        assert clone.edges == expected
+
+    def test_unresolved_labels_dropped(self, fake_graph):
+        fake_graph._lookup_labels = lambda vids: [
+            None if v == 4 else self.LABELS[v] for v in vids
+        ]
+        result = fake_graph.discover(["cnn.com", "bbc.com"])
+        assert [n["domain"] for n in result.nodes] == ["agg.com"]
+        assert all(src == "agg.com" for src, _ in result.edges)
+        assert len(result.edges) == 2
+
+    def test_return_ids(self, fake_graph):
+        fake_graph._lookup_labels = MagicMock()
+        result = fake_graph.discover(
+            ["cnn.com", "bbc.com", "nyt.com"], return_ids=True
+        )
+        assert result.node_ids.tolist() == [3, 4]
+        assert result.counts.tolist() == [3, 2]
+        assert result.percentages.tolist() == [100.0, 66.67]
+        assert sorted(map(tuple, result.edge_ids.tolist())) == [
+            (3, 0), (3, 1), (3, 2), (4, 0), (4, 1),
+        ]
+        fake_graph._lookup_labels.assert_not_called()
+
+    def test_return_ids_rejects_label_formats(self, fake_graph):
+        with pytest.raises(ValueError, match="return_ids"):
+            fake_graph.discover(["cnn.com"], format="networkx", return_ids=True)
+
+    def test_outlink_edges_reversed(self, fake_graph):
+        result = fake_graph.discover(["nyt.com"], direction="outlinks")
+        assert result.edges == [("nyt.com", "agg.com")]
+
+
+class TestLookupLabels:
+    def test_batch_decode(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        loaded_wg._util.vertexIdsToLabels.return_value = b"com.cnn\n\nuk.co.bbc"
+        labels = loaded_wg._lookup_labels([1, 2, 3])
+        assert labels == ["cnn.com", None, "bbc.co.uk"]
+        assert loaded_wg._util.vertexIdsToLabels.call_count == 1
+
+    def test_labels_interned(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        loaded_wg._util.vertexIdsToLabels.return_value = b"com.cnn\ncom.cnn"
+        first, second = loaded_wg._lookup_labels([1, 1])
+        assert first is second
+
+    def test_empty(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        assert loaded_wg._lookup_labels([]) == []
+        loaded_wg._util.vertexIdsToLabels.assert_not_called()
+
+
+class TestLookupIds:
+    def test_batch_decode(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        ids = np.array([42, -1], dtype="<i8")
+        loaded_wg._util.labelsToIds.return_value = ids.tobytes()
+        result = loaded_wg._lookup_ids(["cnn.com", "fake.xyz"])
+        assert result.tolist() == [42, -1]
+        args = loaded_wg._util.labelsToIds.call_args[0]
+        assert args[1] == "com.cnn\nxyz.fake"
+
+    def test_newline_labels_not_sent(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        ids = np.array([42, 43], dtype="<i8")
+        loaded_wg._util.labelsToIds.return_value = ids.tobytes()
+        result = loaded_wg._lookup_ids(["cnn.com", "evil.com\nbbc.com", "bbc.com"])
+        assert result.tolist() == [42, -1, 43]
+        args = loaded_wg._util.labelsToIds.call_args[0]
+        assert args[1] == "com.cnn\ncom.bbc"
+
+    def test_count_mismatch_not_cached(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        ids = np.array([42], dtype="<i8")
+        loaded_wg._util.labelsToIds.return_value = ids.tobytes()
+        with pytest.raises(RuntimeError, match="1 IDs for 2 labels"):
+            loaded_wg._lookup_ids(["cnn.com", "bbc.com"])
+        assert loaded_wg._id_cache == {}
+
+    def test_validate_seeds(self, loaded_wg):
+        loaded_wg._util = MagicMock()
+        ids = np.array([42, -1], dtype="<i8")
+        loaded_wg._util.labelsToIds.return_value = ids.tobytes()
+        found, missing = loaded_wg.validate_seeds([" CNN.com", "fake.xyz"])
+        assert found == ["cnn.com"]
+        assert missing == ["fake.xyz"]
+
+
+class TestIdCache:
+    def test_repeated_lookups_hit_cache(self, loaded_wg):
+        loaded_wg.graph.vertexLabelToId.side_effect = lambda label: {
+            "com.cnn": 7,
+        }.get(label, -1)
+        assert loaded_wg._lookup_ids(["cnn.com", "fake.xyz"]).tolist() == [7, -1]
+        assert loaded_wg.domain_to_id(" CNN.com") == 7
+        assert loaded_wg.domain_to_id("fake.xyz") is None
+        assert loaded_wg.graph.vertexLabelToId.call_count == 2
+
+    def test_cache_is_bounded(self, loaded_wg):
+        loaded_wg._ID_CACHE_SIZE = 2
+        loaded_wg.graph.vertexLabelToId.return_value = 1
+        loaded_wg._lookup_ids(["a.com", "b.com", "c.com"])
+        assert list(loaded_wg._id_cache) == ["b.com", "c.com"]
+
+    def test_hits_survive_eviction(self, loaded_wg):
+        loaded_wg._ID_CACHE_SIZE = 2
+        loaded_wg.graph.vertexLabelToId.return_value = 1
+        loaded_wg._lookup_ids(["a.com", "b.com"])
+        loaded_wg._lookup_ids(["a.com"])
+        loaded_wg._lookup_ids(["c.com"])
+        assert list(loaded_wg._id_cache) == ["a.com", "c.com"]
+        assert loaded_wg.graph.vertexLabelToId.call_count == 3
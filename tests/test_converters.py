@@ -1,7 +1,17 @@
 """Tests for graph format converters."""
 
+import copy
+import json
+import pickle
+
 import pytest
-from pyccwebgraph.converters import DiscoveryResult, to_networkx
+import numpy as np
+from pyccwebgraph.converters import (
+    DiscoveryResult,
+    IdDiscoveryResult,
+    _build_name_map,
+    to_networkx,
+)
 
 
 @pytest.fixture
@@ -39,6 +49,35 @@ class TestDiscoveryResult:
         with pytest.raises(KeyError):
             sample_result["invalid"]
 
+    def test_repr_does_not_build_edges(self):
+        def build():
+            raise AssertionError("edges built by repr")
+
+        result = DiscoveryResult(
+            nodes=[], edges=None, seeds=["b.com"], edges_builder=build,
+            num_edges=4,
+        )
+        assert "4 edges" in repr(result)
+        result = DiscoveryResult(
+            nodes=[], edges=None, seeds=["b.com"], edges_builder=build
+        )
+        assert "edges not built" in repr(result)
+
+    def test_lazy_edges_built_once(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return [("a.com", "b.com")]
+
+        result = DiscoveryResult(
+            nodes=[], edges=None, seeds=["b.com"], edges_builder=build
+        )
+        assert calls == []
+        assert result["edges"] == [("a.com", "b.com")]
+        assert result.edges == [("a.com", "b.com")]
+        assert calls == [1]
+
     def test_empty_result(self):
         result = DiscoveryResult(nodes=[], edges=[], seeds=[])
         assert len(result) == 0
@@ -74,6 +113,46 @@ class TestNetworkXConverter:
         assert G.number_of_nodes() == 5
 
 
+class TestIgraphConverter:
+    def test_basic_conversion(self, sample_result):
+        pytest.importorskip("igraph")
+        G = sample_result.igraph()
+        assert G.vcount() == 5
+        assert G.ecount() == 5
+        assert G.is_directed()
+
+    def test_attributes(self, sample_result):
+        pytest.importorskip("igraph")
+        G = sample_result.igraph()
+        agg = G.vs.find(name="news-agg.com")
+        assert agg["connections"] == 3
+        assert agg["is_seed"] is False
+        assert G.vs.find(name="cnn.com")["is_seed"] is True
+        assert G.are_adjacent(agg.index, G.vs.find(name="nyt.com").index)
+
+    def test_empty(self):
+        pytest.importorskip("igraph")
+        G = DiscoveryResult(nodes=[], edges=[], seeds=[]).igraph()
+        assert G.vcount() == 0
+
+
+class TestIdNetworKitConverter:
+    def test_basic_conversion(self):
+        pytest.importorskip("networkit")
+        result = IdDiscoveryResult(
+            node_ids=np.array([900, 500]),
+            counts=np.array([2, 1]),
+            edge_ids=np.array([[900, 10], [900, 20], [500, 10]]),
+            seed_ids=np.array([10, 20]),
+            seeds=["cnn.com", "bbc.com"],
+        )
+        G, id_map = result.networkit()
+        assert G.numberOfNodes() == 4
+        assert G.numberOfEdges() == 3
+        assert G.hasEdge(id_map[900], id_map[20])
+        assert not G.hasEdge(id_map[20], id_map[900])
+
+
 class TestDataFrameConverter:
     def test_to_dataframe(self, sample_result):
         pd = pytest.importorskip("pandas")
@@ -81,3 +160,124 @@ class TestDataFrameConverter:
         assert isinstance(df, pd.DataFrame)
         assert list(df.columns) == ["domain", "connections", "percentage"]
         assert len(df) == 2
+
+    def test_to_dataframe_copy(self, sample_result):
+        pytest.importorskip("pandas")
+        df = sample_result.to_dataframe()
+        df["connections"] = 0
+        assert sample_result.to_dataframe()["connections"].tolist() == [3, 2]
+        sample_result.nodes = sample_result.nodes[:1]
+        assert len(sample_result.to_dataframe()) == 1
+
+    def test_to_dataframe_keeps_extra_keys(self, sample_result):
+        pytest.importorskip("pandas")
+        sample_result.nodes[0]["tld"] = "com"
+        df = sample_result.to_dataframe()
+        assert list(df.columns) == ["domain", "connections", "percentage", "tld"]
+
+    def test_node_edits_visible(self, sample_result):
+        pytest.importorskip("networkx")
+        sample_result.nodes.append(
+            {"domain": "new.net", "connections": 1, "percentage": 33.33}
+        )
+        sample_result.nodes[0]["connections"] = 7
+        assert len(sample_result) == 3
+        assert sample_result.domains[-1] == "new.net"
+        assert sample_result.networkx().nodes["news-agg.com"]["connections"] == 7
+
+    def test_partial_node_dicts_accepted(self):
+        result = DiscoveryResult(nodes=[{"domain": "a.com"}], edges=[], seeds=[])
+        assert len(result) == 1
+        assert "1 nodes" in repr(result)
+
+
+class TestColumns:
+    def test_from_columns_matches_nodes(self, sample_result):
+        result = DiscoveryResult.from_columns(
+            ["news-agg.com", "blog-site.org"],
+            np.array([3, 2]),
+            np.array([100.0, 66.67]),
+            seeds=sample_result.seeds,
+            edges=sample_result.edges,
+        )
+        assert result.nodes == sample_result.nodes
+        assert len(result) == 2
+
+    def test_nodes_built_lazily(self):
+        result = DiscoveryResult.from_columns(["a.com"], [1], [50.0], seeds=[])
+        assert result._nodes is None
+        assert result["nodes"] == [
+            {"domain": "a.com", "connections": 1, "percentage": 50.0}
+        ]
+
+    def test_column_nodes_editable(self):
+        result = DiscoveryResult.from_columns(["b.com"], [1], [50.0], seeds=[])
+        result.nodes.append({"domain": "a.com", "connections": 2, "percentage": 100.0})
+        result.nodes.sort(key=lambda n: n["domain"])
+        result.nodes[1]["connections"] = 5
+        assert len(result) == 2
+        assert result.domains == ["a.com", "b.com"]
+        assert result.connections.tolist() == [2, 5]
+
+    def test_column_nodes_serializable(self):
+        result = DiscoveryResult.from_columns(["a.com"], [1], [50.0], seeds=[])
+        assert json.loads(json.dumps(result.nodes)) == [
+            {"domain": "a.com", "connections": 1, "percentage": 50.0}
+        ]
+
+    @pytest.mark.parametrize("round_trip", [
+        copy.deepcopy,
+        lambda r: pickle.loads(pickle.dumps(r)),
+    ])
+    @pytest.mark.parametrize("read_nodes", [False, True])
+    def test_column_result_copies(self, round_trip, read_nodes):
+        result = DiscoveryResult.from_columns(
+            ["a.com"], [1], [50.0], seeds=["s.com"], edges=[("a.com", "s.com")]
+        )
+        if read_nodes:
+            result.nodes
+        clone = round_trip(result)
+        assert clone.nodes == result.nodes
+        assert clone.edges == [("a.com", "s.com")]
+        assert copy.copy(clone.nodes[0]) == clone.nodes[0]
+
+    def test_columns_from_node_dicts(self, sample_result):
+        assert sample_result.domains == ["news-agg.com", "blog-site.org"]
+        assert sample_result.connections.tolist() == [3, 2]
+        assert sample_result.percentages.tolist() == [100.0, 66.67]
+
+    def test_compact_column_dtypes(self):
+        result = DiscoveryResult.from_columns(["a.com"], [2], [66.67], seeds=[])
+        assert result.connections.dtype == np.int32
+        assert result.percentages.dtype == np.float32
+
+    def test_dict_percentages_not_rounded(self):
+        nx = pytest.importorskip("networkx")
+        result = DiscoveryResult(
+            nodes=[{"domain": "a.com", "connections": 1, "percentage": 33.3333}],
+            edges=[], seeds=[],
+        )
+        assert result.nodes[0]["percentage"] == 33.3333
+        assert result.networkx().nodes["a.com"]["percentage"] == 33.3333
+
+    def test_float32_percentages_round_trip(self):
+        result = DiscoveryResult.from_columns(["a.com"], [2], [66.67], seeds=[])
+        df = result.to_dataframe()
+        assert df["connections"].dtype == np.int32
+        assert df["percentage"].dtype == np.float32
+        assert result.nodes[0]["percentage"] == 66.67
+
+
+class TestNameMap:
+    def test_first_seen_order(self, sample_result):
+        name_map = _build_name_map(
+            sample_result.domains, sample_result.edges, sample_result.seeds
+        )
+        assert list(name_map) == [
+            "news-agg.com", "blog-site.org", "cnn.com", "bbc.com", "nyt.com",
+        ]
+        assert sorted(name_map.values()) == list(range(5))
+
+    def test_edge_only_domains(self):
+        name_map = _build_name_map([], [("a.com", "b.com")], None)
+        assert name_map == {"a.com": 0, "b.com": 1}
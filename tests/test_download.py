@@ -0,0 +1,310 @@
+"""Tests for download utilities (no network)."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import urllib3
+
+from pyccwebgraph import download
+from pyccwebgraph.download import (
+    build_offsets,
+    download_with_progress,
+    download_webgraph,
+    download_webgraph_async,
+)
+from pyccwebgraph.setup_utils import get_required_files
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    download._pool = None
+    yield
+    download._pool = None
+
+
+def fake_response(body=b"", status=200, headers=None):
+    resp = MagicMock()
+    resp.status = status
+    resp.headers = {"Content-Length": str(len(body)), **(headers or {})}
+    resp.stream.return_value = iter([body[:3], body[3:]])
+    return resp
+
+
+class TestGetPool:
+    def test_urllib3_not_imported_with_package(self):
+        code = "import sys, pyccwebgraph; print('urllib3' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code],
+                             capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
+    def test_reused(self):
+        assert download._get_pool() is download._get_pool()
+
+    def test_grows_for_more_workers(self):
+        small = download._get_pool(1)
+        large = download._get_pool(6)
+        assert large is not small
+        assert download._get_pool(2) is large
+
+
+class TestDownloadWithProgress:
+    def test_streams_to_file(self, tmp_path):
+        dest = tmp_path / "f.graph"
+        pool = MagicMock()
+        pool.request.return_value = fake_response(b"abcdefgh")
+        download_with_progress("http://x/f.graph", str(dest), pool)
+        assert dest.read_bytes() == b"abcdefgh"
+        assert not (tmp_path / "f.graph.part").exists()
+        pool.request.return_value.release_conn.assert_called_once()
+
+    def test_existing_file_skipped(self, tmp_path):
+        dest = tmp_path / "f.graph"
+        dest.write_bytes(b"done")
+        pool = MagicMock()
+        download_with_progress("http://x/f.graph", str(dest), pool)
+        pool.request.assert_not_called()
+
+    def test_http_error_raises(self, tmp_path):
+        dest = tmp_path / "f.graph"
+        pool = MagicMock()
+        pool.request.return_value = fake_response(status=404)
+        with pytest.raises(RuntimeError, match="404"):
+            download_with_progress("http://x/f.graph", str(dest), pool)
+        assert not dest.exists()
+
+    def test_resumes_part_file(self, tmp_path):
+        dest = tmp_path / "f.graph"
+        (tmp_path / "f.graph.part").write_bytes(b"abcd")
+        pool = MagicMock()
+        pool.request.return_value = fake_response(
+            b"efgh", status=206, headers={"Content-Range": "bytes 4-7/8"}
+        )
+        download_with_progress("http://x/f.graph", str(dest), pool)
+        assert pool.request.call_args.kwargs["headers"] == {"Range": "bytes=4-"}
+        assert dest.read_bytes() == b"abcdefgh"
+
+    def test_range_ignored_restarts(self, tmp_path):
+        dest = tmp_path / "f.graph"
+        (tmp_path / "f.graph.part").write_bytes(b"stale")
+        pool = MagicMock()
+        pool.request.return_value = fake_response(b"abcdefgh")
+        download_with_progress("http://x/f.graph", str(dest), pool)
+        assert dest.read_bytes() == b"abcdefgh"
+
+    def test_complete_part_file(self, tmp_path):
+        dest = tmp_path / "f.graph"
+        (tmp_path / "f.graph.part").write_bytes(b"abcdefgh")
+        pool = MagicMock()
+        pool.request.return_value = fake_response(status=416)
+        download_with_progress("http://x/f.graph", str(dest), pool)
+        assert dest.read_bytes() == b"abcdefgh"
+
+    def test_retries_dropped_connection(self, tmp_path):
+        dest = tmp_path / "f.graph"
+        pool = MagicMock()
+        pool.request.side_effect = [
+            urllib3.exceptions.ProtocolError("reset"),
+            fake_response(b"abcdefgh"),
+        ]
+        with patch("pyccwebgraph.download.time.sleep") as sleep:
+            download_with_progress("http://x/f.graph", str(dest), pool)
+        sleep.assert_called_once()
+        assert dest.read_bytes() == b"abcdefgh"
+
+    def test_truncated_body_resumed(self, tmp_path):
+        dest = tmp_path / "f.graph"
+        pool = MagicMock()
+        pool.request.side_effect = [
+            fake_response(b"abcd", headers={"Content-Length": "8"}),
+            fake_response(b"efgh", status=206,
+                          headers={"Content-Range": "bytes 4-7/8"}),
+        ]
+        with patch("pyccwebgraph.download.time.sleep") as sleep:
+            download_with_progress("http://x/f.graph", str(dest), pool)
+        sleep.assert_called_once()
+        assert pool.request.call_args.kwargs["headers"] == {"Range": "bytes=4-"}
+        assert dest.read_bytes() == b"abcdefgh"
+
+    def test_truncated_body_not_renamed(self, tmp_path):
+        dest = tmp_path / "f.graph"
+        pool = MagicMock()
+        pool.request.side_effect = lambda *a, **kw: fake_response(
+            b"", headers={"Content-Length": "8"}
+        )
+        with patch("pyccwebgraph.download.time.sleep"):
+            with pytest.raises(RuntimeError, match="0 of 8 bytes"):
+                download_with_progress("http://x/f.graph", str(dest), pool)
+        assert not dest.exists()
+
+    def test_request_timeout(self, tmp_path):
+        pool = MagicMock()
+        pool.request.return_value = fake_response(b"abcdefgh")
+        download_with_progress("http://x/f.graph", str(tmp_path / "f"), pool)
+        timeout = pool.request.call_args.kwargs["timeout"]
+        assert timeout.read_timeout == download.READ_TIMEOUT
+        assert timeout.connect_timeout == download.CONNECT_TIMEOUT
+
+
+class TestDownloadWebgraph:
+    def test_downloads_all_files(self, tmp_path):
+        version = "cc-main-2024-feb-apr-may"
+        pool = MagicMock()
+        pool.request.side_effect = lambda *a, **kw: fake_response(b"data")
+        with patch("urllib3.PoolManager", return_value=pool), \
+                patch("pyccwebgraph.download.build_offsets"):
+            download_webgraph(str(tmp_path), version)
+        for f in get_required_files(version):
+            assert (tmp_path / f).read_bytes() == b"data"
+
+    def test_present_files_not_fetched(self, tmp_path):
+        version = "cc-main-2024-feb-apr-may"
+        for f in get_required_files(version):
+            (tmp_path / f).write_bytes(b"data")
+        with patch("urllib3.PoolManager") as pool_cls, \
+                patch("pyccwebgraph.download.build_offsets"):
+            download_webgraph(str(tmp_path), version)
+        pool_cls.assert_not_called()
+
+
+class TestDownloadWebgraphAsync:
+    """download_webgraph_async() against a local aiohttp file server."""
+
+    VERSION = "cc-main-2024-feb-apr-may"
+
+    def run_against_server(self, src_dir, dest_dir):
+        web = pytest.importorskip("aiohttp.web")
+
+        async def main():
+            app = web.Application()
+            app.router.add_static(f"/projects/hyperlinkgraph/{self.VERSION}/domain",
+                                  str(src_dir))
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            real_pending = download._pending_downloads
+
+            def local_pending(webgraph_dir, version):
+                return [
+                    (url.replace("https://data.commoncrawl.org",
+                                 f"http://127.0.0.1:{port}"), dest)
+                    for url, dest in real_pending(webgraph_dir, version)
+                ]
+
+            try:
+                with patch("pyccwebgraph.download._pending_downloads",
+                           side_effect=local_pending), \
+                        patch("pyccwebgraph.download.build_offsets"):
+                    await download_webgraph_async(str(dest_dir), self.VERSION)
+            finally:
+                await runner.cleanup()
+
+        asyncio.run(main())
+
+    def test_downloads_and_resumes(self, tmp_path):
+        src, dest = tmp_path / "src", tmp_path / "dest"
+        src.mkdir()
+        dest.mkdir()
+        files = get_required_files(self.VERSION)
+        for f in files:
+            (src / f).write_bytes(f.encode() * 100)
+        # A half-finished download is continued, not restarted
+        partial = (src / files[1]).read_bytes()[:50]
+        (dest / (files[1] + ".part")).write_bytes(partial)
+
+        self.run_against_server(src, dest)
+        for f in files:
+            assert (dest / f).read_bytes() == (src / f).read_bytes()
+            assert not (dest / (f + ".part")).exists()
+
+    def test_writes_off_event_loop(self, tmp_path):
+        src, dest = tmp_path / "src", tmp_path / "dest"
+        src.mkdir()
+        dest.mkdir()
+        for f in get_required_files(self.VERSION):
+            (src / f).write_bytes(b"data")
+
+        write_threads = set()
+        real_write = download._PartWriter.write
+
+        def write(self, chunk):
+            write_threads.add(threading.get_ident())
+            real_write(self, chunk)
+
+        with patch.object(download._PartWriter, "write", write):
+            self.run_against_server(src, dest)
+        assert write_threads
+        assert threading.get_ident() not in write_threads
+
+
+class TestBuildOffsets:
+    VERSION = "cc-main-2024-feb-apr-may"
+
+    @staticmethod
+    def fake_popen(returncode=0, stderr=(), make_offsets=True):
+        def popen(cmd, **kwargs):
+            if make_offsets:
+                open(cmd[-1] + ".offsets", "w").close()
+            proc = MagicMock()
+            proc.stderr = MagicMock()
+            proc.stderr.__iter__.return_value = iter(stderr)
+            proc.wait.return_value = returncode
+            return proc
+        return popen
+
+    def test_runs_both_graphs(self, tmp_path):
+        with patch("pyccwebgraph.download.subprocess.Popen",
+                   side_effect=self.fake_popen()) as mock_popen:
+            build_offsets(str(tmp_path), self.VERSION, jar_path="x.jar")
+        assert mock_popen.call_count == 2
+        assert all(c.args[0][1].startswith("-Xmx") for c in mock_popen.call_args_list)
+
+    def test_existing_offsets_skipped(self, tmp_path):
+        (tmp_path / f"{self.VERSION}-domain.offsets").touch()
+        (tmp_path / f"{self.VERSION}-domain-t.offsets").touch()
+        with patch("pyccwebgraph.download.subprocess.Popen") as mock_popen, \
+                patch("pyccwebgraph.download.find_jar") as mock_find_jar:
+            build_offsets(str(tmp_path), self.VERSION)
+        mock_popen.assert_not_called()
+        mock_find_jar.assert_not_called()
+
+    def test_failures_aggregated(self, tmp_path):
+        popen = self.fake_popen(returncode=1, stderr=["starting\n", "boom\n"],
+                                make_offsets=False)
+        with patch("pyccwebgraph.download.subprocess.Popen", side_effect=popen):
+            with pytest.raises(RuntimeError) as exc:
+                build_offsets(str(tmp_path), self.VERSION, jar_path="x.jar")
+        message = str(exc.value)
+        assert f"{self.VERSION}-domain: starting\nboom" in message
+        assert f"{self.VERSION}-domain-t: starting\nboom" in message
+
+    def test_timeout_kills_process(self, tmp_path):
+        def popen(cmd, **kwargs):
+            killed = threading.Event()
+            proc = MagicMock()
+            proc.stderr = MagicMock()
+            proc.stderr.__iter__.return_value = iter(())
+            proc.kill.side_effect = killed.set
+            proc.wait.side_effect = lambda: killed.wait(5) and -9
+            return proc
+
+        with patch("pyccwebgraph.download.subprocess.Popen", side_effect=popen), \
+                patch("pyccwebgraph.download.OFFSETS_TIMEOUT", 0):
+            with pytest.raises(RuntimeError, match="Timeout"):
+                build_offsets(str(tmp_path), self.VERSION, jar_path="x.jar")
+
+    def test_interrupted_read_kills_process(self, tmp_path):
+        proc = MagicMock()
+        proc.stderr = MagicMock()
+        proc.stderr.__iter__.side_effect = KeyboardInterrupt
+        proc.poll.return_value = None
+        with patch("pyccwebgraph.download.subprocess.Popen", return_value=proc):
+            with pytest.raises(KeyboardInterrupt):
+                build_offsets(str(tmp_path), self.VERSION, jar_path="x.jar")
+        proc.kill.assert_called()
+        assert proc.wait.called
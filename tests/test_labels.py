@@ -0,0 +1,74 @@
+"""Tests for the memory-mapped label index."""
+
+import gzip
+
+import pytest
+from pyccwebgraph.labels import LabelIndex, build_label_index
+from pyccwebgraph.setup_utils import check_label_index
+
+VERSION = "test-version"
+LABELS = ["com.bbc", "com.cnn", "org.example", "uk.co.bbc"]
+
+
+def write_vertices(path, labels, ids=None):
+    with gzip.open(path / f"{VERSION}-domain-vertices.txt.gz", "wt") as f:
+        for i, label in zip(ids or range(len(labels)), labels):
+            f.write(f"{i}\t{label}\t1\n")
+
+
+@pytest.fixture
+def index(tmp_path):
+    write_vertices(tmp_path, LABELS)
+    build_label_index(str(tmp_path), VERSION, chunk_size=2)
+    idx = LabelIndex.open(str(tmp_path), VERSION)
+    yield idx
+    idx.close()
+
+
+class TestLabelIndex:
+    def test_len(self, index):
+        assert len(index) == 4
+
+    def test_label(self, index):
+        assert index.label(0) == "com.bbc"
+        assert index.label(3) == "uk.co.bbc"
+        assert index.label(4) is None
+        assert index.label(-1) is None
+
+    def test_labels_batch(self, index):
+        assert index.labels([2, 99, 1]) == ["org.example", None, "com.cnn"]
+
+    def test_lookup(self, index):
+        for i, label in enumerate(LABELS):
+            assert index.lookup(label) == i
+        assert index.lookup("com.bb") == -1
+        assert index.lookup("zz.missing") == -1
+
+    def test_open_missing_returns_none(self, tmp_path):
+        assert LabelIndex.open(str(tmp_path), VERSION) is None
+
+    @pytest.mark.parametrize("labels, ids", [
+        (["com.cnn", "com.bbc"], None),
+        (["com.bbc", "com.bbc"], None),
+        (["com.bbc", "com.cnn"], [0, 2]),
+    ])
+    def test_unsorted_vertices_rejected(self, tmp_path, labels, ids):
+        write_vertices(tmp_path, labels, ids)
+        with pytest.raises(ValueError, match="line 2"):
+            build_label_index(str(tmp_path), VERSION)
+        assert not check_label_index(str(tmp_path), VERSION)[0]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            f"{VERSION}-domain-vertices.txt.gz"
+        ]
+
+
+class TestCheckLabelIndex:
+    def test_missing(self, tmp_path):
+        ok, missing = check_label_index(str(tmp_path), VERSION)
+        assert not ok
+        assert len(missing) == 2
+
+    def test_present(self, tmp_path, index):
+        ok, missing = check_label_index(str(tmp_path), VERSION)
+        assert ok
+        assert missing == []
@@ -1,16 +1,30 @@
 """Tests for setup utilities."""
 
 import os
+from unittest.mock import patch
+
 import pytest
 from pyccwebgraph.setup_utils import (
+    _clear_setup_caches,
     check_java,
+    find_helper_jar,
+    find_jar,
     check_webgraph_data,
     get_required_files,
     check_offsets,
+    check_ram,
+    total_ram_bytes,
     DEFAULT_VERSION,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    _clear_setup_caches()
+    yield
+    _clear_setup_caches()
+
+
 class TestCheckJava:
     def test_returns_tuple(self):
         ok, msg = check_java()
@@ -21,6 +35,98 @@ class TestCheckJava:
         ok, msg = check_java(min_version=999)
         assert not ok
 
+    def test_result_cached(self):
+        with patch("pyccwebgraph.setup_utils.shutil.which",
+                   return_value=None) as which:
+            check_java()
+            check_java()
+            check_java(min_version=21)
+        assert which.call_count == 1
+
+
+class TestJavaReleaseFile:
+    def make_jdk(self, tmp_path, version):
+        (tmp_path / "bin").mkdir()
+        java = tmp_path / "bin" / "java"
+        java.touch()
+        (tmp_path / "release").write_text(
+            f'IMPLEMENTOR="Eclipse Adoptium"\nJAVA_VERSION="{version}"\n'
+        )
+        return str(java)
+
+    def test_reads_release_without_subprocess(self, tmp_path):
+        java = self.make_jdk(tmp_path, "21.0.2")
+        with patch("pyccwebgraph.setup_utils.shutil.which", return_value=java), \
+                patch("pyccwebgraph.setup_utils.subprocess.run") as run:
+            ok, msg = check_java()
+        assert ok
+        assert msg == "Java 21"
+        run.assert_not_called()
+
+    def test_old_release_fails(self, tmp_path):
+        java = self.make_jdk(tmp_path, "11.0.1")
+        with patch("pyccwebgraph.setup_utils.shutil.which", return_value=java):
+            ok, msg = check_java()
+        assert not ok
+        assert "Java 11 found" in msg
+
+
+class TestFindJar:
+    def test_explicit_path(self, tmp_path):
+        jar = tmp_path / "x.jar"
+        jar.touch()
+        assert find_jar(str(jar)) == str(jar)
+
+    def test_env_var(self, tmp_path, monkeypatch):
+        jar = tmp_path / "env.jar"
+        jar.touch()
+        monkeypatch.setenv("CC_WEBGRAPH_JAR", str(jar))
+        assert find_jar() == str(jar)
+
+    def test_bundled_hit_skips_getcwd(self, tmp_path, monkeypatch):
+        jar = tmp_path / "bundled.jar"
+        jar.touch()
+        monkeypatch.delenv("CC_WEBGRAPH_JAR", raising=False)
+        with patch("pyccwebgraph.setup_utils._BUNDLED_JAR", str(jar)), \
+                patch("pyccwebgraph.setup_utils.os.getcwd") as getcwd:
+            assert find_jar() == str(jar)
+        getcwd.assert_not_called()
+
+    def test_env_var_directory_ignored(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CC_WEBGRAPH_JAR", str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+        with patch("pyccwebgraph.setup_utils._BUNDLED_JAR", str(tmp_path / "no.jar")), \
+                patch("pyccwebgraph.setup_utils._PKG_DIR", str(tmp_path)):
+            with pytest.raises(FileNotFoundError):
+                find_jar()
+
+    def test_missing_explicit_path_not_cached(self, tmp_path):
+        jar = tmp_path / "x.jar"
+        with pytest.raises(FileNotFoundError):
+            find_jar(str(jar))
+        jar.touch()
+        assert find_jar(str(jar)) == str(jar)
+
+
+class TestFindHelperJar:
+    def test_bundled(self, tmp_path, monkeypatch):
+        jar = tmp_path / "pyccwebgraph-helpers.jar"
+        jar.touch()
+        monkeypatch.delenv("PYCCWEBGRAPH_HELPER_JAR", raising=False)
+        with patch("pyccwebgraph.setup_utils._HELPER_JAR", str(jar)):
+            assert find_helper_jar() == str(jar)
+
+    def test_env_var(self, tmp_path, monkeypatch):
+        jar = tmp_path / "helpers.jar"
+        jar.touch()
+        monkeypatch.setenv("PYCCWEBGRAPH_HELPER_JAR", str(jar))
+        assert find_helper_jar() == str(jar)
+
+    def test_missing(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("PYCCWEBGRAPH_HELPER_JAR", raising=False)
+        with patch("pyccwebgraph.setup_utils._HELPER_JAR", str(tmp_path / "no.jar")):
+            assert find_helper_jar() is None
+
 
 class TestGetRequiredFiles:
     def test_file_count(self):
@@ -40,6 +146,11 @@ class TestCheckWebgraphData:
         assert not ok
         assert len(missing) == 6
 
+    def test_nonexistent_dir(self, tmp_path):
+        ok, missing = check_webgraph_data(str(tmp_path / "nope"), DEFAULT_VERSION)
+        assert not ok
+        assert len(missing) == 6
+
     def test_all_present(self, tmp_path):
         version = DEFAULT_VERSION
         for f in get_required_files(version):
@@ -61,3 +172,19 @@ class TestCheckOffsets:
         (tmp_path / f"{version}-domain-t.offsets").touch()
         ok, missing = check_offsets(str(tmp_path), version)
         assert ok
+
+
+class TestCheckRam:
+    def test_total_ram_positive(self):
+        total = total_ram_bytes()
+        assert total is None or total > 0
+
+    def test_threshold(self):
+        with patch("pyccwebgraph.setup_utils.total_ram_bytes",
+                   return_value=16 * 1024 ** 3):
+            assert check_ram(min_gb=8)
+            assert not check_ram(min_gb=20)
+
+    def test_unknown_assumes_ok(self):
+        with patch("pyccwebgraph.setup_utils.total_ram_bytes", return_value=None):
+            assert check_ram(min_gb=10 ** 6)